@@ -8,7 +8,7 @@ SQLiteデータベースからテンプレートを提供するプロバイダ
 TemplateProviderインターフェースを実装し、データベースアクセスを抽象化します。
 """
 
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple, Union
 import logging
 import json
 import sqlite3
@@ -22,6 +22,22 @@ from ..utils.exceptions import DatabaseError, TemplateError
 logger = logging.getLogger(__name__)
 
 
+class TemplateSummary(NamedTuple):
+    """
+    テンプレート検索・一覧結果の1行分の要約
+
+    結果1行ごとのdict生成はアロケーションコストが大きいため、
+    軽量なNamedTupleで返します。JSONシリアライズが必要な場合は
+    `._asdict()` で辞書に変換できます。
+    """
+    intent: str
+    description: str
+    category: str
+    is_system: bool
+    tags: Tuple[str, ...]
+    score: int = 0
+
+
 class SqliteTemplateProvider(TemplateProvider):
     """
     SQLiteデータベースからテンプレートを提供するクラス
@@ -31,6 +47,44 @@ class SqliteTemplateProvider(TemplateProvider):
     永続化に使用されます。
     """
     
+    # 検索SQLの定数化（毎回の文字列構築を避け、sqlite3の文キャッシュに
+    # 同一のSQLテキストを渡してプリペアドステートメントを再利用させる）
+    _SEARCH_SQL = """
+    SELECT t.id, t.intent, t.description, t.category, t.is_system,
+           (CASE
+               WHEN t.intent LIKE ? THEN 3
+               WHEN t.description LIKE ? THEN 2
+               WHEN t.category LIKE ? THEN 1
+               ELSE 0
+           END) AS score
+    FROM templates t
+    WHERE t.intent LIKE ? OR t.description LIKE ? OR t.category LIKE ?
+    UNION
+    SELECT t.id, t.intent, t.description, t.category, t.is_system, 1 AS score
+    FROM templates t
+    JOIN template_tags tt ON t.id = tt.template_id
+    WHERE tt.tag LIKE ?
+    ORDER BY score DESC
+    LIMIT ?
+    """
+
+    # update_templateで取りうる3種類のSQL形状を事前に構築しておく
+    # キー: (template_contentを更新するか, descriptionを更新するか)
+    _UPDATE_SQL = {
+        (True, False): (
+            "UPDATE templates SET template_content = ?, "
+            "updated_at = CURRENT_TIMESTAMP WHERE intent = ?"
+        ),
+        (False, True): (
+            "UPDATE templates SET description = ?, "
+            "updated_at = CURRENT_TIMESTAMP WHERE intent = ?"
+        ),
+        (True, True): (
+            "UPDATE templates SET template_content = ?, description = ?, "
+            "updated_at = CURRENT_TIMESTAMP WHERE intent = ?"
+        ),
+    }
+
     def __init__(self, db_path: Optional[str] = None):
         """
         SQLiteテンプレートプロバイダーを初期化します
@@ -104,22 +158,25 @@ class SqliteTemplateProvider(TemplateProvider):
         """
         query = "SELECT intent FROM templates"
         cursor = self.db_manager.execute(query)
-        
+
         if cursor is None:
             return []
-        
-        return [row["intent"] for row in cursor.fetchall()]
+
+        # fetchallで全行を先に確保せず、カーソルを直接イテレートして
+        # C層にまとめて行を取得させる（arraysizeで1回あたりの取得数を調整）
+        cursor.arraysize = 256
+        return [row["intent"] for row in cursor]
     
-    def search_templates(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def search_templates(self, query: str, limit: int = 10) -> List[TemplateSummary]:
         """
         クエリに基づいてテンプレートを検索します
-        
+
         Args:
             query: 検索クエリ
             limit: 返す結果の最大数
-            
+
         Returns:
-            検索結果のリスト（各エントリは辞書形式）
+            検索結果のリスト（各エントリはTemplateSummary）
             
         Raises:
             TemplateError: 検索中にエラーが発生した場合
@@ -130,31 +187,17 @@ class SqliteTemplateProvider(TemplateProvider):
                 return []
 
             # LIKE演算子で使用する検索ワイルドカード文字をエスケープ
-            escaped_query = self.db_manager.escape_like_string(query)
+            # メタ文字を含まないクエリ（大半のケース）はエスケープ処理と
+            # 文字列の再構築をスキップする
+            if "%" in query or "_" in query or "\\" in query:
+                escaped_query = self.db_manager.escape_like_string(query)
+            else:
+                escaped_query = query
             search_term = f"%{escaped_query}%"
             
-            # 検索結果をスコア付けするSQL
-            sql = """
-            SELECT t.id, t.intent, t.description, t.category, t.is_system,
-                   (CASE 
-                       WHEN t.intent LIKE ? THEN 3
-                       WHEN t.description LIKE ? THEN 2
-                       WHEN t.category LIKE ? THEN 1
-                       ELSE 0
-                   END) AS score
-            FROM templates t
-            WHERE t.intent LIKE ? OR t.description LIKE ? OR t.category LIKE ?
-            UNION
-            SELECT t.id, t.intent, t.description, t.category, t.is_system, 1 AS score
-            FROM templates t
-            JOIN template_tags tt ON t.id = tt.template_id
-            WHERE tt.tag LIKE ?
-            ORDER BY score DESC
-            LIMIT ?
-            """
-            
+            # 検索結果をスコア付けするSQL（クラス定数として事前構築済み）
             params = (search_term, search_term, search_term, search_term, search_term, search_term, search_term, limit)
-            cursor = self.db_manager.execute(sql, params)
+            cursor = self.db_manager.execute(self._SEARCH_SQL, params)
             
             results = []
             for row in cursor.fetchall():
@@ -165,18 +208,17 @@ class SqliteTemplateProvider(TemplateProvider):
                         (row["id"],)
                     )
                     
-                    tags = [tag_row["tag"] for tag_row in tags_cursor.fetchall()]
-                    
+                    tags = tuple(tag_row["tag"] for tag_row in tags_cursor.fetchall())
+
                     # 結果を構築
-                    result = {
-                        "intent": row["intent"],
-                        "description": row["description"],
-                        "category": row["category"],
-                        "is_system": bool(row["is_system"]),
-                        "tags": tags,
-                        "score": row["score"]
-                    }
-                    results.append(result)
+                    results.append(TemplateSummary(
+                        intent=row["intent"],
+                        description=row["description"],
+                        category=row["category"],
+                        is_system=bool(row["is_system"]),
+                        tags=tags,
+                        score=row["score"]
+                    ))
                 except Exception as e:
                     logger.warning(f"検索結果の処理中にエラー: {str(e)}")
                     continue
@@ -193,7 +235,7 @@ class SqliteTemplateProvider(TemplateProvider):
             logger.error(error_msg)
             raise TemplateError(error_msg)
     
-    def get_templates_by_category(self, category: str) -> List[Dict[str, Any]]:
+    def get_templates_by_category(self, category: str) -> List[TemplateSummary]:
         """
         指定されたカテゴリに属するテンプレートを取得します
         
@@ -210,33 +252,34 @@ class SqliteTemplateProvider(TemplateProvider):
         """
         
         cursor = self.db_manager.execute(query, (category,))
-        
+
         if cursor is None:
             return []
-        
+
+        # 結果全体をfetchallで確保せず、カーソルをストリーミングで処理
+        cursor.arraysize = 256
         results = []
-        for row in cursor.fetchall():
+        for row in cursor:
             # タグを取得
             tags_cursor = self.db_manager.execute(
                 "SELECT tag FROM template_tags WHERE template_id = ?",
                 (row["id"],)
             )
             
-            tags = [tag_row["tag"] for tag_row in tags_cursor.fetchall()] if tags_cursor else []
-            
+            tags = tuple(tag_row["tag"] for tag_row in tags_cursor.fetchall()) if tags_cursor else ()
+
             # 結果を構築
-            result = {
-                "intent": row["intent"],
-                "description": row["description"],
-                "category": row["category"],
-                "is_system": bool(row["is_system"]),
-                "tags": tags
-            }
-            results.append(result)
-        
+            results.append(TemplateSummary(
+                intent=row["intent"],
+                description=row["description"],
+                category=row["category"],
+                is_system=bool(row["is_system"]),
+                tags=tags
+            ))
+
         return results
-    
-    def get_templates_by_tag(self, tag: str) -> List[Dict[str, Any]]:
+
+    def get_templates_by_tag(self, tag: str) -> List[TemplateSummary]:
         """
         指定されたタグを持つテンプレートを取得します
         
@@ -254,33 +297,68 @@ class SqliteTemplateProvider(TemplateProvider):
         """
         
         cursor = self.db_manager.execute(query, (tag,))
-        
+
         if cursor is None:
             return []
-        
+
+        # 結果全体をfetchallで確保せず、カーソルをストリーミングで処理
+        cursor.arraysize = 256
         results = []
-        for row in cursor.fetchall():
+        for row in cursor:
             # タグを取得
             tags_cursor = self.db_manager.execute(
                 "SELECT tag FROM template_tags WHERE template_id = ?",
                 (row["id"],)
             )
             
-            tags = [tag_row["tag"] for tag_row in tags_cursor.fetchall()] if tags_cursor else []
-            
+            tags = tuple(tag_row["tag"] for tag_row in tags_cursor.fetchall()) if tags_cursor else ()
+
             # 結果を構築
-            result = {
-                "intent": row["intent"],
-                "description": row["description"],
-                "category": row["category"],
-                "is_system": bool(row["is_system"]),
-                "tags": tags
-            }
-            results.append(result)
-        
+            results.append(TemplateSummary(
+                intent=row["intent"],
+                description=row["description"],
+                category=row["category"],
+                is_system=bool(row["is_system"]),
+                tags=tags
+            ))
+
         return results
     
-    def add_template(self, intent: str, template: str, description: str, 
+    # 1文あたりのタグ挿入数の上限（SQLiteのパラメータ数制限999を超えないように設定）
+    _TAG_INSERT_CHUNK = 400
+
+    def _insert_tags(self, template_id: int, tags: List[str]) -> bool:
+        """
+        テンプレートにタグを一括挿入します
+
+        executemanyによる1タグ1文の挿入はドライバ呼び出しのオーバーヘッドが
+        大きいため、複数の `(?, ?)` を連結した単一のINSERT文にまとめます。
+        SQLiteのパラメータ数制限を超えないようにチャンク分割します。
+
+        引数:
+            template_id: タグを関連付けるテンプレートのID
+            tags: 挿入するタグのリスト
+
+        戻り値:
+            すべてのタグの挿入に成功した場合はTrue、それ以外はFalse
+        """
+        for start in range(0, len(tags), self._TAG_INSERT_CHUNK):
+            chunk = tags[start:start + self._TAG_INSERT_CHUNK]
+            tag_query = (
+                "INSERT INTO template_tags (template_id, tag) VALUES "
+                + ",".join(["(?, ?)"] * len(chunk))
+            )
+            params = []
+            for tag in chunk:
+                params.append(template_id)
+                params.append(tag)
+
+            if self.db_manager.execute(tag_query, tuple(params)) is None:
+                return False
+
+        return True
+
+    def add_template(self, intent: str, template: str, description: str,
                      category: Optional[str] = None, tags: Optional[List[str]] = None) -> bool:
         """
         新しいテンプレートを追加します
@@ -322,12 +400,7 @@ class SqliteTemplateProvider(TemplateProvider):
         
         # タグを追加（存在する場合）
         if tags and template_id:
-            tag_values = [(template_id, tag) for tag in tags]
-            tag_query = "INSERT INTO template_tags (template_id, tag) VALUES (?, ?)"
-            
-            tag_cursor = self.db_manager.executemany(tag_query, tag_values)
-            
-            if tag_cursor is None:
+            if not self._insert_tags(template_id, tags):
                 logger.warning(f"テンプレートは追加されましたが、タグの追加に失敗しました: {intent}")
                 # テンプレート自体は追加されたのでコミット
                 self.db_manager.commit()
@@ -362,35 +435,21 @@ class SqliteTemplateProvider(TemplateProvider):
             logger.warning(f"更新するテンプレートが見つかりません: {intent}")
             return False
         
-        # 更新するフィールドを構築
-        update_fields = []
+        # 更新するフィールドがない場合
+        if template is None and description is None:
+            logger.warning(f"更新するフィールドが指定されていません: {intent}")
+            return False
+
+        # 事前構築済みのSQL形状を選択（毎回のf-string構築とパース・プランを回避）
+        update_query = self._UPDATE_SQL[(template is not None, description is not None)]
+
         params = []
-        
         if template is not None:
-            update_fields.append("template_content = ?")
             params.append(template)
-        
         if description is not None:
-            update_fields.append("description = ?")
             params.append(description)
-        
-        # 更新するフィールドがない場合
-        if not update_fields:
-            logger.warning(f"更新するフィールドが指定されていません: {intent}")
-            return False
-        
-        # 更新タイムスタンプを追加
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
-        
-        # 更新クエリを構築
-        update_query = f"""
-        UPDATE templates
-        SET {', '.join(update_fields)}
-        WHERE intent = ?
-        """
-        
         params.append(intent)
-        
+
         # クエリを実行
         cursor = self.db_manager.execute(update_query, tuple(params))
         
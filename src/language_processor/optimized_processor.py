@@ -8,17 +8,148 @@ SPACO - 最適化された言語処理モジュール
 最適化された処理を提供します。
 """
 
+import bisect
+import functools
 import logging
-from typing import Dict, Any, Optional, List, Union
+import re
+from typing import Dict, Any, Optional, List, Tuple, Union
 
-from .representation.optimized_converter import OptimizedConversionPipeline
+# OptimizedConversionPipelineは変換器スタック全体を引き込むため、
+# モジュールロード時ではなくプロセッサー構築時に初めてインポートする
+# （意図レベルのみ使用する呼び出し側のインポートコストを抑える）
 from .representation.intent_level import IntentLevel, IntentType
-from .representation.parameter_level import ParameterLevel
-from .representation.structure_level import StructureLevel
-from .representation.code_level import CodeLevel
 
 logger = logging.getLogger(__name__)
 
+# 意図キーワードの選択肢正規表現（モジュールロード時に1回だけコンパイル）
+_KEYWORD_RE = re.compile(
+    r"(エフェクト|effect|シーケンス|sequence|メロディ|melody|楽器|instrument)",
+    re.IGNORECASE
+)
+
+# キーワード（小文字化済み）→ 意図タイプの対応表
+_INTENT_MAP = {
+    "エフェクト": IntentType.APPLY_EFFECT,
+    "effect": IntentType.APPLY_EFFECT,
+    "シーケンス": IntentType.CREATE_SEQUENCE,
+    "sequence": IntentType.CREATE_SEQUENCE,
+    "メロディ": IntentType.CREATE_MELODY,
+    "melody": IntentType.CREATE_MELODY,
+    "楽器": IntentType.GENERATE_INSTRUMENT,
+    "instrument": IntentType.GENERATE_INSTRUMENT,
+}
+
+# 周波数表記の正規表現（例: "440Hz", "440 Hz"）
+_FREQ_RE = re.compile(r"(\d+)\s*Hz", re.IGNORECASE)
+
+# 波形キーワード → 正規化された波形名の対応表
+_WAVEFORM_MAP = {
+    "正弦波": "sine",
+    "sine": "sine",
+    "ノコギリ波": "saw",
+    "saw": "saw",
+    "矩形波": "square",
+    "square": "square",
+    "三角波": "triangle",
+    "triangle": "triangle",
+}
+
+# 波形キーワードの選択肢正規表現（1回のスキャンで全波形を判定）
+_WF_RE = re.compile(
+    r"(正弦波|sine|ノコギリ波|saw|矩形波|square|三角波|triangle)",
+    re.IGNORECASE
+)
+
+# 意図・波形キーワードの先頭文字の集合
+# （いずれも含まない指示はキーワード走査自体をスキップできる）
+_TRIGGER_CHARS = frozenset("esmitESMIT" "エシメ楽正ノ矩三")
+
+# 抽出パラメータの固定形状テンプレート
+# （毎回リテラルから構築する代わりにcopy()して"value"のみ埋める）
+_FREQ_TMPL = {"value_type": "static", "unit": "Hz"}
+_WF_TMPL = {"value_type": "static"}
+
+# pyahocorasickが利用可能な場合は、意図・波形キーワードを1つの
+# オートマトンにまとめ、1回の線形走査で全キーワードを検出する
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _build_keyword_automaton():
+    """意図・波形キーワードのAho-Corasickオートマトンを構築します。"""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword, intent_type in _INTENT_MAP.items():
+        automaton.add_word(keyword, ("intent", intent_type))
+    for keyword, waveform in _WAVEFORM_MAP.items():
+        automaton.add_word(keyword, ("waveform", waveform))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _parse_instruction(instruction: str) -> Tuple[IntentType, Optional[str], Optional[float]]:
+    """
+    指示文字列から意図タイプ・波形・周波数を解析します。
+
+    入力文字列のみに依存する純粋関数であり、呼び出し側で
+    functools.lru_cacheによりメモ化されます。
+
+    引数:
+        instruction: 自然言語の指示
+
+    戻り値:
+        Tuple[IntentType, Optional[str], Optional[float]]:
+            意図タイプ、波形名（なければNone）、周波数（なければNone）
+    """
+    intent_type = None
+    waveform = None
+
+    # キーワードの先頭文字が1つも含まれない指示（数値のみの指定など）は
+    # オートマトン／正規表現による走査をスキップしてデフォルト意図に直行する
+    if _TRIGGER_CHARS.isdisjoint(instruction):
+        pass
+    elif _KEYWORD_AUTOMATON is not None:
+        # Aho-Corasickオートマトンによる1回の線形走査で
+        # 意図・波形キーワードをまとめて検出（カテゴリごとに最初の一致を採用）
+        lower = instruction.lower()
+        for _, (category, value) in _KEYWORD_AUTOMATON.iter(lower):
+            if category == "intent":
+                if intent_type is None:
+                    intent_type = value
+            elif waveform is None:
+                waveform = value
+            if intent_type is not None and waveform is not None:
+                break
+    else:
+        # フォールバック: コンパイル済みの選択肢正規表現で1回ずつスキャン
+        keyword_match = _KEYWORD_RE.search(instruction)
+        if keyword_match:
+            intent_type = _INTENT_MAP[keyword_match.group(1).lower()]
+
+        # 波形キーワードごとの部分文字列スキャンの代わりに
+        # 選択肢正規表現で1回だけスキャンする
+        wf_match = _WF_RE.search(instruction)
+        if wf_match:
+            waveform = _WAVEFORM_MAP[wf_match.group(1).lower()]
+
+    if intent_type is None:
+        intent_type = IntentType.GENERATE_SOUND  # デフォルト
+
+    # 周波数の抽出
+    frequency = None
+    freq_match = _FREQ_RE.search(instruction)
+    if freq_match:
+        frequency = float(freq_match.group(1))
+
+    return intent_type, waveform, frequency
+
 
 class OptimizedLanguageProcessor:
     """
@@ -37,13 +168,21 @@ class OptimizedLanguageProcessor:
             cache_size: 各変換器のキャッシュサイズ
             enable_cache_stats: キャッシュの統計情報を収集するかどうか
         """
+        # 変換パイプラインのインポートを初回の構築まで遅延する
+        from .representation.optimized_converter import OptimizedConversionPipeline
+
         self.pipeline = OptimizedConversionPipeline(
             cache_size=cache_size,
             cache_stats=enable_cache_stats
         )
         self.cache_size = cache_size
         self.enable_cache_stats = enable_cache_stats
-    
+        # 同一の指示文字列に対する再解析を避けるため、解析結果をメモ化する
+        self._parse_instruction = functools.lru_cache(maxsize=cache_size)(_parse_instruction)
+        # 統計が無効な場合のprocess内の分岐と辞書構築を避けるため、
+        # アクセサを構築時に一度だけ束縛する（無効時はNone）
+        self._get_stats = self._collect_cache_stats if enable_cache_stats else None
+
     def process(self, instruction: str) -> Dict[str, Any]:
         """
         自然言語の指示を処理し、SuperColliderコードを生成します。
@@ -55,37 +194,57 @@ class OptimizedLanguageProcessor:
             Dict[str, Any]: 処理結果（コード、メタデータなど）
         """
         try:
-            # 指示から意図を抽出
-            intent = self._extract_intent(instruction)
-            
-            # 意図からコードを生成
-            code_level = self.pipeline.convert_intent_to_code(intent)
-            
-            # SuperColliderコードを生成
-            sc_code = code_level.generate_code()
-            
-            # 結果を返す
-            result = {
-                "success": True,
-                "code": sc_code,
-                "metadata": {
-                    "intent": intent.to_dict(),
-                    "code_type": code_level.code_type.name
-                }
-            }
-            
-            # キャッシュ統計情報を含める（有効な場合）
-            if self.enable_cache_stats:
-                result["cache_stats"] = self.pipeline.get_cache_stats()
-            
-            return result
+            return self._process_inner(instruction)
         except Exception as e:
-            logger.error(f"言語処理中にエラーが発生しました: {str(e)}", exc_info=True)
+            # トレースバックの収集・整形はデバッグレベルが有効な場合のみ行う
+            # （フォールバックが頻発するワークロードでの整形コストを避ける）
+            logger.error(
+                f"言語処理中にエラーが発生しました: {str(e)}",
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             return {
                 "success": False,
                 "error": str(e),
                 "error_type": type(e).__name__
             }
+
+    def _process_inner(self, instruction: str) -> Dict[str, Any]:
+        """
+        例外処理を持たないprocessの本体です。
+
+        ホットパスを例外フレームの設定なしでフラットに保ちます。
+        上位でエラー処理を行う呼び出し側は直接このメソッドを使用できます。
+
+        引数:
+            instruction: 自然言語の指示
+
+        戻り値:
+            Dict[str, Any]: 処理結果（コード、メタデータなど）
+        """
+        # 指示から意図を抽出
+        intent = self._extract_intent(instruction)
+
+        # 意図からコードを生成
+        code_level = self.pipeline.convert_intent_to_code(intent)
+
+        # SuperColliderコードを生成
+        sc_code = code_level.generate_code()
+
+        # 結果を返す
+        result = {
+            "success": True,
+            "code": sc_code,
+            "metadata": {
+                "intent": intent.to_dict_cached(),
+                "code_type": code_level.code_type.name
+            }
+        }
+
+        # キャッシュ統計情報を含める（有効な場合）
+        if self._get_stats is not None:
+            result["cache_stats"] = self._get_stats()
+
+        return result
     
     def _extract_intent(self, instruction: str) -> IntentLevel:
         """
@@ -97,53 +256,41 @@ class OptimizedLanguageProcessor:
         戻り値:
             IntentLevel: 抽出された意図レベルの表現
         """
-        # 意図タイプを決定（簡易的な実装）
-        intent_type = IntentType.GENERATE_SOUND  # デフォルト
-        
-        if "エフェクト" in instruction or "effect" in instruction.lower():
-            intent_type = IntentType.APPLY_EFFECT
-        elif "シーケンス" in instruction or "sequence" in instruction.lower():
-            intent_type = IntentType.CREATE_SEQUENCE
-        elif "メロディ" in instruction or "melody" in instruction.lower():
-            intent_type = IntentType.CREATE_MELODY
-        elif "楽器" in instruction or "instrument" in instruction.lower():
-            intent_type = IntentType.GENERATE_INSTRUMENT
-            
+        # 解析はメモ化された純粋関数に委譲する
+        intent_type, waveform, frequency = self._parse_instruction(instruction)
+        return self._build_intent(instruction, intent_type, waveform, frequency)
+
+    def _build_intent(self, instruction: str, intent_type: IntentType,
+                      waveform: Optional[str],
+                      frequency: Optional[float]) -> IntentLevel:
+        """
+        解析済みの (意図タイプ, 波形, 周波数) から意図レベルを構築します。
+
+        引数:
+            instruction: 自然言語の指示
+            intent_type: 解析された意図タイプ
+            waveform: 波形名（なければNone）
+            frequency: 周波数（なければNone）
+
+        戻り値:
+            IntentLevel: 構築された意図レベルの表現
+        """
         # パラメータを抽出（簡易的な実装）
         extracted_parameters = {}
-        
+
         # 周波数の抽出
-        if "Hz" in instruction:
-            import re
-            match = re.search(r'(\d+)Hz', instruction)
-            if match:
-                frequency = float(match.group(1))
-                extracted_parameters["frequency"] = {
-                    "value_type": "static",
-                    "value": frequency,
-                    "unit": "Hz"
-                }
-        
+        if frequency is not None:
+            freq_param = _FREQ_TMPL.copy()
+            freq_param["value"] = frequency
+            extracted_parameters["frequency"] = freq_param
+
         # 波形の抽出
-        waveforms = {
-            "正弦波": "sine",
-            "sine": "sine",
-            "ノコギリ波": "saw",
-            "saw": "saw",
-            "矩形波": "square",
-            "square": "square",
-            "三角波": "triangle",
-            "triangle": "triangle"
-        }
-        
-        for jp, en in waveforms.items():
-            if jp in instruction or en in instruction.lower():
-                extracted_parameters["waveform"] = {
-                    "value_type": "static",
-                    "value": en
-                }
-                break
-                
+        if waveform is not None:
+            wf_param = _WF_TMPL.copy()
+            wf_param["value"] = waveform
+            extracted_parameters["waveform"] = wf_param
+
+
         # 意図レベルの表現を作成
         metadata = {}
         if extracted_parameters:
@@ -151,7 +298,89 @@ class OptimizedLanguageProcessor:
             
         intent = IntentLevel(intent_type, instruction, metadata)
         return intent
-    
+
+    def process_batch(self, instructions: List[str]) -> List[Dict[str, Any]]:
+        """
+        複数の自然言語指示をまとめて処理します。
+
+        指示ごとに正規表現スキャンを繰り返す代わりに、全指示を
+        1つのコーパスに連結して各正規表現を1回ずつ走査し、
+        一致位置から指示インデックスを逆引きします。大量の指示を
+        処理する場合、指示ごとの正規表現起動コストを償却できます。
+
+        引数:
+            instructions: 自然言語の指示のリスト
+
+        戻り値:
+            List[Dict[str, Any]]: 指示ごとの処理結果（processと同じ形式）
+        """
+        if not instructions:
+            return []
+
+        # 指示をセンチネル文字で連結した単一コーパスを構築する
+        # （\x00は\dやキーワードに一致しないため、境界をまたぐ誤検出はない）
+        corpus = "\x00".join(instructions)
+
+        # 各指示の開始オフセット（一致位置 → 指示インデックスの逆引き用）
+        starts = [0]
+        for instruction in instructions[:-1]:
+            starts.append(starts[-1] + len(instruction) + 1)
+
+        count = len(instructions)
+        intent_types: List[Optional[IntentType]] = [None] * count
+        waveforms: List[Optional[str]] = [None] * count
+        frequencies: List[Optional[float]] = [None] * count
+
+        # 各正規表現をコーパス全体に対して1回ずつ走査する
+        # （指示ごとに最初の一致のみを採用し、逐次処理と同じ結果にする）
+        for match in _KEYWORD_RE.finditer(corpus):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            if intent_types[index] is None:
+                intent_types[index] = _INTENT_MAP[match.group(1).lower()]
+
+        for match in _WF_RE.finditer(corpus):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            if waveforms[index] is None:
+                waveforms[index] = _WAVEFORM_MAP[match.group(1).lower()]
+
+        for match in _FREQ_RE.finditer(corpus):
+            index = bisect.bisect_right(starts, match.start()) - 1
+            if frequencies[index] is None:
+                frequencies[index] = float(match.group(1))
+
+        # 解析結果から指示ごとに意図の構築とコード生成を行う
+        results = []
+        for i, instruction in enumerate(instructions):
+            intent_type = intent_types[i]
+            if intent_type is None:
+                intent_type = IntentType.GENERATE_SOUND  # デフォルト
+
+            try:
+                intent = self._build_intent(
+                    instruction, intent_type, waveforms[i], frequencies[i])
+                code_level = self.pipeline.convert_intent_to_code(intent)
+                result = {
+                    "success": True,
+                    "code": code_level.generate_code(),
+                    "metadata": {
+                        "intent": intent.to_dict_cached(),
+                        "code_type": code_level.code_type.name
+                    }
+                }
+            except Exception as e:
+                logger.error(
+                    f"言語処理中にエラーが発生しました: {str(e)}",
+                    exc_info=logger.isEnabledFor(logging.DEBUG)
+                )
+                result = {
+                    "success": False,
+                    "error": str(e),
+                    "error_type": type(e).__name__
+                }
+            results.append(result)
+
+        return results
+
     def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
         """
         キャッシュの統計情報を返します。
@@ -161,24 +390,53 @@ class OptimizedLanguageProcessor:
         """
         if not self.enable_cache_stats:
             return {"enabled": False}
-            
-        return self.pipeline.get_cache_stats()
+
+        return self._collect_cache_stats()
+
+    def _collect_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        パイプラインと意図抽出キャッシュの統計情報をまとめて返します。
+
+        戻り値:
+            Dict[str, Dict[str, Any]]: キャッシュの統計情報
+        """
+        stats = self.pipeline.get_cache_stats()
+        cache_info = self._parse_instruction.cache_info()
+        stats["intent_extraction"] = {
+            "hits": cache_info.hits,
+            "misses": cache_info.misses,
+            "maxsize": cache_info.maxsize,
+            "currsize": cache_info.currsize
+        }
+        return stats
     
     def clear_cache(self) -> None:
         """
         すべてのキャッシュをクリアします。
         """
-        # 各変換器のキャッシュをクリア
-        self.pipeline.intent_to_param._convert_impl.cache_clear()
-        self.pipeline.param_to_structure._convert_impl.cache_clear()
-        self.pipeline.structure_to_code._convert_impl.cache_clear()
-        
+        # 意図抽出キャッシュをクリア
+        self._parse_instruction.cache_clear()
+
+        # 各変換器のキャッシュクリアはパイプラインに委譲
+        self.pipeline.clear_cache()
+
         logger.info("すべての変換キャッシュがクリアされました")
 
 
 # グローバルな最適化プロセッサーインスタンス
 # アプリケーション全体で共有するためのシングルトン
-optimized_processor = OptimizedLanguageProcessor(
-    cache_size=256,  # デフォルトのキャッシュサイズ
-    enable_cache_stats=True  # 統計情報を有効化
-)
+# インポート時に変換パイプライン全体を構築しないよう、
+# PEP 562のモジュール__getattr__で初回アクセスまで生成を遅延する
+_instance: Optional[OptimizedLanguageProcessor] = None
+
+
+def __getattr__(name: str) -> OptimizedLanguageProcessor:
+    global _instance
+    if name == "optimized_processor":
+        if _instance is None:
+            _instance = OptimizedLanguageProcessor(
+                cache_size=256,  # デフォルトのキャッシュサイズ
+                enable_cache_stats=True  # 統計情報を有効化
+            )
+        return _instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
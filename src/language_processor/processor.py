@@ -13,10 +13,68 @@ import re
 import logging
 import json
 import os
+import string
 from typing import Dict, Any, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# numbaが利用可能な場合は数値正規化をJITコンパイルする
+# （大量の指示をバッチ処理する場合にのみ効果がある）
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _normalize_params(freq: float, amp: float, duration: float) -> Tuple[float, float, float]:
+    """
+    抽出された数値パラメーターを妥当な範囲に正規化します。
+
+    純粋な数値演算のみで構成されており、numbaが存在する場合は
+    JITコンパイルされます。
+
+    引数:
+        freq: 周波数（Hz）
+        amp: 振幅（0.0〜1.0）
+        duration: 持続時間（秒）
+
+    戻り値:
+        Tuple[float, float, float]: 正規化された (freq, amp, duration)
+    """
+    if freq <= 0.0:
+        freq = 440.0
+    if amp < 0.0:
+        amp = 0.0
+    elif amp > 1.0:
+        amp = 1.0
+    if duration <= 0.0:
+        duration = 1.0
+    return freq, amp, duration
+
+
+if njit is not None:
+    _normalize_params = njit(cache=True)(_normalize_params)
+
+
+# パターン内の名前付きグループを非キャプチャグループに変換する正規表現
+# （選択肢正規表現への融合時に、同名グループの重複定義を避けるために使用）
+_INNER_GROUP_RE = re.compile(r"\(\?P<\w+>")
+
+
+def _normalize_note(note: str) -> str:
+    """
+    音符名にオクターブがない場合は"4"を補います（例: "A" -> "A4"）。
+
+    引数:
+        note: 音符名（例: "A"、"A#"、"A4"）
+
+    戻り値:
+        str: オクターブ付きの音符名
+    """
+    if note[-1].isdigit():
+        return note
+    return note + "4"
+
 
 class LanguageProcessorError(Exception):
     """言語プロセッサー関連のエラー基底クラス"""
@@ -72,15 +130,17 @@ class LanguageProcessor:
     def _initialize_patterns(self):
         """パターン辞書を初期化します"""
         # 意図認識パターン
+        # キャプチャグループの名前（hz / note）が抽出値の種類を直接示すため、
+        # パラメーター抽出時に文字列の分類カスケードが不要になる
         self.intent_patterns = {
             "generate_sine": [
-                r"(\d+)\s*(?:Hz|ヘルツ)の(?:正弦波|サイン波)",
-                r"サイン波を(\d+)\s*(?:Hz|ヘルツ)で",
-                r"([A-G][#b]?\d?)(?:の音|音|)\s*(?:を鳴らして|を生成して)"
+                r"(?P<hz>\d+)\s*(?:Hz|ヘルツ)の(?:正弦波|サイン波)",
+                r"サイン波を(?P<hz>\d+)\s*(?:Hz|ヘルツ)で",
+                r"(?P<note>[A-G][#b]?\d?)(?:の音|音|)\s*(?:を鳴らして|を生成して)"
             ],
             "generate_sawtooth": [
-                r"ノコギリ波.+?(\d+)\s*(?:Hz|ヘルツ)",
-                r"([A-G][#b]?\d?).+?ノコギリ波"
+                r"ノコギリ波.+?(?P<hz>\d+)\s*(?:Hz|ヘルツ)",
+                r"(?P<note>[A-G][#b]?\d?).+?ノコギリ波"
             ],
             "generate_pad": [
                 r"パッドサウンド",
@@ -92,6 +152,28 @@ class LanguageProcessor:
             ]
         }
         
+        # 個別パターンのコンパイル済みキャッシュ（パターン文字列 → コンパイル済み正規表現）
+        self._compiled_patterns = {}
+        for patterns in self.intent_patterns.values():
+            for pattern in patterns:
+                self._compiled_patterns[pattern] = re.compile(pattern, re.IGNORECASE)
+
+        # 全意図パターンを1つの選択肢（alternation）正規表現に融合する
+        # 意図×パターンごとのre.search呼び出しを1回のスキャンに置き換え、
+        # 一致したグループ名から意図と元パターンを逆引きする
+        self._intent_group_map = {}
+        alternation_parts = []
+        for intent, patterns in self.intent_patterns.items():
+            for i, pattern in enumerate(patterns):
+                group_name = f"{intent}__{i}"
+                self._intent_group_map[group_name] = (intent, pattern)
+                # パターン内部の名前付きグループは非キャプチャに変換する
+                # （hz / noteが複数パターンで重複定義になるのを防ぐ。
+                # 値の抽出は個別にコンパイルしたパターン側で行う）
+                stripped = _INNER_GROUP_RE.sub("(?:", pattern)
+                alternation_parts.append(f"(?P<{group_name}>{stripped})")
+        self._intent_regex = re.compile("|".join(alternation_parts), re.IGNORECASE)
+
         # 音符名と周波数のマッピング
         self.note_to_freq = {
             "C4": 261.63, "C#4": 277.18, "D4": 293.66, "D#4": 311.13,
@@ -154,7 +236,39 @@ s.waitForBoot({{
 }});
 """
         }
-    
+
+        # テンプレートを (リテラル, フィールド名, 書式指定) の列に事前パースする
+        # str.formatの毎回のテンプレート再パースを初期化時の1回に置き換える
+        formatter = string.Formatter()
+        self._compiled_templates = {
+            intent: list(formatter.parse(template))
+            for intent, template in self.templates.items()
+        }
+
+        # さらに、フィールドが既知のテンプレートは専用の関数オブジェクトに
+        # コンパイルする。引数を直接受け取る文字列連結のみの関数になるため、
+        # ホットパスでの辞書アンパックやformatのディスパッチを排除できる
+        self._template_fns = {}
+        known_fields = {"freq", "amp", "duration"}
+        for intent, parts in self._compiled_templates.items():
+            fields = {field for _, field, _, _ in parts if field}
+            if not fields <= known_fields:
+                # 未知のフィールドを含むテンプレートはパース済み列で処理する
+                continue
+            pieces = []
+            for literal, field, spec, _ in parts:
+                if literal:
+                    pieces.append(repr(literal))
+                if field:
+                    pieces.append(f"format({field}, {spec!r})")
+            source = (
+                f"def _gen_{intent}(freq, amp, duration):\n"
+                f"    return {' + '.join(pieces)}\n"
+            )
+            namespace: Dict[str, Any] = {}
+            exec(compile(source, f"<template:{intent}>", "exec"), namespace)
+            self._template_fns[intent] = namespace[f"_gen_{intent}"]
+
     def process(self, input_text: str) -> Dict[str, Any]:
         """
         自然言語指示を処理してSuperColliderコードを生成します。
@@ -236,12 +350,11 @@ s.waitForBoot({{
         例外:
             IntentRecognitionError: 意図認識に失敗した場合
         """
-        for intent, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, input_text, re.IGNORECASE)
-                if match:
-                    return intent, pattern
-        
+        # 融合済みの選択肢正規表現で1回だけスキャンする
+        match = self._intent_regex.search(input_text)
+        if match:
+            return self._intent_group_map[match.lastgroup]
+
         # 意図を認識できなかった場合
         raise IntentRecognitionError(f"意図を認識できませんでした: {input_text}")
     
@@ -265,28 +378,35 @@ s.waitForBoot({{
         try:
             # 周波数の抽出
             if intent in ["generate_sine", "generate_sawtooth"]:
-                match = re.search(matched_pattern, input_text)
+                # コンパイル済みパターンを再利用する（未知のパターン文字列は
+                # 呼び出し側が直接指定した場合のみコンパイルする）
+                compiled = self._compiled_patterns.get(matched_pattern)
+                if compiled is None:
+                    compiled = re.compile(matched_pattern, re.IGNORECASE)
+                match = compiled.search(input_text)
                 if match:
-                    value = match.group(1)
-                    
-                    # 音符名の場合
-                    if value in self.note_to_freq:
-                        params["freq"] = self.note_to_freq[value]
-                    # 数値の場合
-                    elif value.isdigit():
-                        params["freq"] = float(value)
-                    # A4などの簡易表記を処理
-                    elif re.match(r"[A-G][#b]?\d?", value):
-                        note = value
-                        if len(note) == 1:  # A -> A4
-                            note = note + "4"
-                        elif len(note) == 2 and note[1] in "#b":  # A# -> A#4
-                            note = note + "4"
-                        
-                        if note in self.note_to_freq:
-                            params["freq"] = self.note_to_freq[note]
+                    groups = match.groupdict()
+                    if groups:
+                        # 一致したグループの名前が値の種類を直接示すため、
+                        # 文字列の分類カスケードなしでディスパッチできる
+                        hz = groups.get("hz")
+                        if hz:
+                            params["freq"] = float(hz)
                         else:
-                            params["freq"] = 440.0  # デフォルトはA4
+                            note = groups.get("note")
+                            if note:
+                                params["freq"] = self.note_to_freq.get(
+                                    _normalize_note(note), 440.0)  # デフォルトはA4
+                    else:
+                        # 旧形式のパターン（位置グループ）との互換処理
+                        value = match.group(1)
+                        if value in self.note_to_freq:
+                            params["freq"] = self.note_to_freq[value]
+                        elif value.isdigit():
+                            params["freq"] = float(value)
+                        elif re.match(r"[A-G][#b]?\d?", value):
+                            params["freq"] = self.note_to_freq.get(
+                                _normalize_note(value), 440.0)  # デフォルトはA4
             
             # 音量の抽出
             volume_match = re.search(r"音量[をは]?(\d+)%", input_text)
@@ -316,18 +436,17 @@ s.waitForBoot({{
         戻り値:
             Dict[str, Any]: デフォルト値が設定されたパラメーター辞書
         """
-        # デフォルト値
-        defaults = {
-            "freq": 440.0,  # A4
-            "amp": 0.5,     # 中程度の音量
-            "duration": 1.0  # 1秒
-        }
-        
-        # 不足しているパラメーターにデフォルト値を設定
-        for param, default_value in defaults.items():
-            if param not in params:
-                params[param] = default_value
-        
+        # 不足しているパラメーターにデフォルト値を設定し、数値を正規化
+        freq, amp, duration = _normalize_params(
+            params.get("freq", 440.0),      # A4
+            params.get("amp", 0.5),         # 中程度の音量
+            params.get("duration", 1.0)     # 1秒
+        )
+
+        params["freq"] = freq
+        params["amp"] = amp
+        params["duration"] = duration
+
         return params
     
     def _generate_code(self, intent: str, params: Dict[str, Any]) -> str:
@@ -345,15 +464,23 @@ s.waitForBoot({{
             CodeGenerationError: コード生成に失敗した場合
         """
         try:
-            # テンプレートの取得
-            if intent not in self.templates:
+            # 事前パース済みテンプレートの取得
+            parts = self._compiled_templates.get(intent)
+            if parts is None:
                 raise CodeGenerationError(f"テンプレートが見つかりません: {intent}")
-            
-            template = self.templates[intent]
-            
-            # テンプレートにパラメーターを適用
-            code = template.format(**params)
-            
+
+            # テンプレート専用にコンパイルされた関数があればそれを使用する
+            fn = self._template_fns.get(intent)
+            if fn is not None and "freq" in params and "amp" in params and "duration" in params:
+                return fn(params["freq"], params["amp"], params["duration"])
+
+            # パース済みの (リテラル, フィールド名, 書式指定) 列を連結するだけで
+            # コードを生成する（str.formatのテンプレート再パースを回避）
+            code = "".join(
+                literal + (format(params[field], spec or "") if field else "")
+                for literal, field, spec, _ in parts
+            )
+
             return code
             
         except Exception as e:
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SPACO - 表現レベルの基底クラス
+
+このモジュールは、自然言語からSuperColliderコードへの変換過程で使用される
+各表現レベル（意図、パラメータ、構造、コード）の共通基底クラスと
+検証エラーを提供します。
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+import json
+import logging
+
+# orjsonが利用可能な場合はJSONシリアライズに使用する（大幅に高速）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class ValidationError(Exception):
+    """表現レベルの検証に関するエラー"""
+
+    def __init__(self, message, level=None, details=None):
+        super().__init__(message)
+        self.level = level
+        self.details = details or {}
+
+
+class RepresentationLevel(ABC):
+    """
+    表現レベルの抽象基底クラス
+
+    各表現レベル（意図、パラメータ、構造、コード）に共通する
+    検証・辞書変換・JSON変換のインターフェースを定義します。
+    """
+
+    # 固定スロットにすることでインスタンスごとの__dict__を省き、
+    # 大量の表現オブジェクトを扱う際のメモリ使用量を抑える
+    # （サブクラスも自身の属性を__slots__で宣言すること）
+    __slots__ = ("_is_valid", "_validated", "_dict_cache", "_cache_key")
+
+    def __init__(self):
+        """表現レベルを初期化します。"""
+        self._is_valid = False
+        # validate()を一度でも実行したかどうか（False/未検証を区別する）
+        self._validated = False
+        # to_dict_cachedのメモ化用キャッシュ
+        # 不変のインスタンスでは同じ辞書オブジェクトを再利用する
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        # メモ化変換器が構築するキャッシュキーの保存先
+        # （キーの構築は1インスタンスにつき1回で済ませる）
+        self._cache_key: Optional[Any] = None
+
+    @abstractmethod
+    def validate(self) -> bool:
+        """
+        この表現レベルの内容を検証します。
+
+        戻り値:
+            bool: 内容が妥当な場合はTrue
+        """
+        raise NotImplementedError
+
+    def is_valid(self) -> bool:
+        """
+        この表現レベルが妥当かどうかを返します（検証結果は保持されます）。
+
+        戻り値:
+            bool: 内容が妥当な場合はTrue
+        """
+        if not self._validated:
+            self._is_valid = self.validate()
+            self._validated = True
+        return self._is_valid
+
+    @abstractmethod
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        この表現レベルを辞書形式に変換します。
+
+        戻り値:
+            Dict[str, Any]: 辞書形式の表現
+        """
+        raise NotImplementedError
+
+    def to_dict_cached(self) -> Dict[str, Any]:
+        """
+        to_dict()の結果をメモ化して返します。
+
+        インスタンスが変更されない限り、同じ辞書オブジェクトを返すため、
+        レスポンス生成などのホットパスでの辞書構築を節約できます。
+        インスタンスを変更するメソッドは_invalidate_cache()を呼び出して
+        キャッシュを破棄する必要があります。
+
+        戻り値:
+            Dict[str, Any]: 辞書形式の表現（共有オブジェクト、変更不可）
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self.to_dict()
+        return self._dict_cache
+
+    def _invalidate_cache(self) -> None:
+        """インスタンスの変更時に内部キャッシュを破棄します。"""
+        self._dict_cache = None
+        self._cache_key = None
+        self._is_valid = False
+        self._validated = False
+
+    @classmethod
+    @abstractmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RepresentationLevel":
+        """
+        辞書形式から表現レベルを構築します。
+
+        引数:
+            data: 辞書形式の表現
+
+        戻り値:
+            RepresentationLevel: 構築された表現レベル
+        """
+        raise NotImplementedError
+
+    def to_json(self) -> str:
+        """
+        この表現レベルをJSON文字列に変換します（コンパクト形式）。
+
+        人間向けの整形された出力にはto_pretty_json()を使用してください。
+
+        戻り値:
+            str: JSON形式の文字列
+        """
+        if orjson is not None:
+            return orjson.dumps(
+                self.to_dict(), option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    def to_pretty_json(self) -> str:
+        """
+        この表現レベルを整形されたJSON文字列に変換します。
+
+        戻り値:
+            str: インデント付きのJSON形式の文字列
+        """
+        if orjson is not None:
+            return orjson.dumps(
+                self.to_dict(),
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+            ).decode()
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_json()})"
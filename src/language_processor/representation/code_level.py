@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SPACO - コードレベルの表現
+
+このモジュールは、変換パイプラインの最終段階である
+SuperColliderコードの表現レベルを提供します。テンプレートと
+変数のマッピングから実行可能なコードを生成します。
+"""
+
+from enum import Enum, auto
+from types import MappingProxyType
+from typing import Dict, Any, KeysView, List, Mapping, Optional, Set, Tuple
+import functools
+import logging
+import re
+
+from .base import RepresentationLevel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# シンセ系ファクトリーで共有するテンプレート
+# （オシレーター式のみが異なるため、共通部分を1箇所で定義する）
+_SYNTH_TEMPLATE_BASE = """s.waitForBoot({
+    {
+        var sig = __OSC__;
+        sig = sig * EnvGen.kr(Env.linen(0.01, {{duration}}, 0.01), doneAction: 2);
+        sig ! 2
+    }.play;
+});"""
+
+_SINE_TEMPLATE = _SYNTH_TEMPLATE_BASE.replace(
+    "__OSC__", "SinOsc.ar({{freq}}, 0, {{amp}})")
+_SAW_TEMPLATE = _SYNTH_TEMPLATE_BASE.replace(
+    "__OSC__", "Saw.ar({{freq}}, {{amp}})")
+_SQUARE_TEMPLATE = _SYNTH_TEMPLATE_BASE.replace(
+    "__OSC__", "Pulse.ar({{freq}}, 0.5, {{amp}})")
+
+# メタデータ未指定時に共有する空の読み取り専用マッピング
+# （インスタンスごとの空辞書の割り当てを避ける。書き込み前には
+# _ensure_mutable_metadata()で可変の辞書に差し替えること）
+_EMPTY_META: Mapping[str, Any] = MappingProxyType({})
+
+# 変数未指定時に共有する空の読み取り専用マッピング
+# （定型文のみのテンプレートでのインスタンスごとの辞書割り当てを避ける。
+# add_variableが最初の書き込み時に可変の辞書へ差し替える）
+_EMPTY_VARS: Mapping[str, "CodeVariable"] = MappingProxyType({})
+
+
+def _format_sc_string(value: str) -> str:
+    """
+    文字列をSuperColliderの文字列リテラルに変換します。
+
+    大半の値（波形名・ノート名など）はエスケープ不要なため、
+    まず in 検索（Cレベルの memchr 相当）で確認し、必要な場合のみ
+    replaceを実行します。バックスラッシュは引用符より先に
+    エスケープする必要があります。
+    """
+    if '"' not in value and "\\" not in value:
+        return f'"{value}"'
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _format_sc_list(value: list) -> str:
+    """リストをSuperColliderの配列リテラルに変換します。"""
+    return "[" + ", ".join(_to_sc_literal(element) for element in value) + "]"
+
+
+# 値の型 → SuperColliderリテラル変換関数の対応表
+# （type()による完全一致で引くため、isinstanceの連鎖より高速。
+# boolは独自の型を持つのでintと衝突しない）
+_LITERAL_FORMATTERS = {
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    float: str,
+    str: _format_sc_string,
+    list: _format_sc_list,
+}
+
+
+def _to_sc_literal(value: Any) -> str:
+    """値をSuperColliderのリテラル表記に変換します。"""
+    return _LITERAL_FORMATTERS.get(type(value), str)(value)
+
+
+# CodeVariableの辞書形式のフィールド名（from_dictの一括読み出し用）
+_CV_FIELDS = ("name", "value", "metadata")
+
+# `{{変数名}}`形式のプレースホルダーの正規表現
+# （モジュールロード時に1回だけコンパイルし、検証・生成の両方で再利用する）
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+@functools.lru_cache(maxsize=256)
+def _split_template(template: str) -> Tuple[str, ...]:
+    """
+    テンプレートをプレースホルダーで分割した結果をキャッシュします。
+
+    ファクトリーメソッド経由で同じテンプレート文字列から大量の
+    インスタンスが生成されるため、分割はプロセス全体で
+    テンプレートごとに1回だけ行います。奇数番目の要素が変数名です。
+
+    引数:
+        template: `{{変数名}}`形式のプレースホルダーを含むテンプレート
+
+    戻り値:
+        Tuple[str, ...]: 分割されたセグメント列（共有オブジェクト）
+    """
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+def _compile_batch_renderer(template: str, assume_str: bool = False):
+    """
+    freq/amp/durationを直接受け取るレンダリング関数を生成します。
+
+    CodeLevelやCodeVariableのオブジェクトグラフを構築せずに
+    テンプレートを埋められるため、大量のコード片を一括生成する
+    バッチ経路で使用します。
+
+    引数:
+        template: `{{変数名}}`形式のプレースホルダーを含むテンプレート
+        assume_str: Trueの場合、引数が文字列化済みであることを前提に
+            関数内のstr()変換を省略する（バッチ経路で値列をmap(str, ...)
+            により一括変換する場合に使用）
+
+    戻り値:
+        Callable: (freq, amp, duration) を受け取りコード文字列を返す関数
+    """
+    segments = _PLACEHOLDER_RE.split(template)
+    pieces = []
+    for i, segment in enumerate(segments):
+        if i % 2:
+            pieces.append(segment if assume_str else f"str({segment})")
+        elif segment:
+            pieces.append(repr(segment))
+    source = "def _render(freq, amp, duration):\n    return {}\n".format(
+        " + ".join(pieces))
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<code_level:batch>", "exec"), namespace)
+    return namespace["_render"]
+
+
+# 正弦波テンプレートのバッチ用レンダリング関数（モジュールロード時に生成）
+_RENDER_SINE = _compile_batch_renderer(_SINE_TEMPLATE)
+
+# 文字列化済みの値を受け取る変種（バッチ経路の一括変換用）
+_RENDER_SINE_STR = _compile_batch_renderer(_SINE_TEMPLATE, assume_str=True)
+
+
+class CodeType(Enum):
+    """コードの種類"""
+    SYNTH = auto()         # 単一のシンセコード
+    EFFECT_CHAIN = auto()  # エフェクトチェーンコード
+    SEQUENCE = auto()      # シーケンスコード
+    INSTRUMENT = auto()    # 楽器定義コード
+    RAW = auto()           # 生のコード
+    UNKNOWN = auto()       # 不明なコード
+
+
+# 名前 → CodeTypeメンバーの対応表
+# （EnumMeta.__getitem__より高速で、未知の名前もget()で処理できる）
+_CODE_TYPE_BY_NAME: Dict[str, CodeType] = {m.name: m for m in CodeType}
+
+
+class CodeVariable:
+    """
+    コードテンプレートに埋め込む単一の変数
+
+    変数の名前と値を保持し、値をSuperColliderのリテラル表記に
+    変換する機能を提供します。
+    """
+
+    # コード生成では大量の変数インスタンスが作られるため、
+    # __dict__を持たない固定スロットでメモリ使用量を抑える
+    __slots__ = ("name", "value", "metadata")
+
+    def __init__(self, name: str, value: Any,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        コード変数を初期化します。
+
+        引数:
+            name: 変数名
+            value: 変数の値
+            metadata: 追加のメタデータ
+        """
+        self.name = name
+        self.value = value
+        self.metadata = metadata if metadata else _EMPTY_META
+
+    def _ensure_mutable_metadata(self) -> Dict[str, Any]:
+        """メタデータへの書き込み前に可変の辞書であることを保証します。"""
+        if type(self.metadata) is not dict:
+            self.metadata = dict(self.metadata)
+        return self.metadata
+
+    def __getstate__(self):
+        """pickle用の状態を返します（共有センチネルはNoneに置き換え）。"""
+        state = super().__getstate__()
+        slots = state[1]
+        if slots.get("metadata") is _EMPTY_META:
+            slots["metadata"] = None
+        return state
+
+    def __setstate__(self, state):
+        """pickleされた状態を復元します（センチネルの共有も戻します）。"""
+        slots = state[1]
+        if slots.get("metadata") is None:
+            slots["metadata"] = _EMPTY_META
+        for name, value in slots.items():
+            setattr(self, name, value)
+
+    def to_code(self) -> str:
+        """
+        変数の値をSuperColliderのリテラル表記に変換します。
+
+        戻り値:
+            str: SuperColliderのリテラル表記
+        """
+        return _to_sc_literal(self.value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """コード変数を辞書形式に変換します。"""
+        return {
+            "name": self.name,
+            "value": self.value,
+            # 共有の読み取り専用マッピングを漏らさないよう通常の辞書で返す
+            "metadata": dict(self.metadata)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CodeVariable":
+        """辞書形式からコード変数を構築します。"""
+        # フィールドを一括で読み出す（大量の変数を復元する際の
+        # デフォルト引数処理付きgetの繰り返しを避ける）
+        name, value, metadata = map(data.get, _CV_FIELDS)
+        return cls(name or "", value, metadata)
+
+
+class CodeLevel(RepresentationLevel):
+    """
+    コードレベルの表現クラス
+
+    コードの種類、`{{変数名}}`形式のプレースホルダーを含むテンプレート、
+    および変数のマッピングを保持し、SuperColliderコードを生成します。
+    """
+
+    __slots__ = ("code_type", "template", "variables", "metadata",
+                 "_placeholders", "_segments", "_render_fn")
+
+    def __init__(self, code_type: CodeType, template: str,
+                 variables: Optional[Dict[str, CodeVariable]] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        コードレベルの表現を初期化します。
+
+        引数:
+            code_type: コードの種類
+            template: `{{変数名}}`形式のプレースホルダーを含むテンプレート
+            variables: 変数名 → コード変数のマッピング
+            metadata: 追加のメタデータ
+        """
+        super().__init__()
+        self.code_type = code_type
+        self.template = template
+        self.variables = variables if variables else _EMPTY_VARS
+        self.metadata = metadata if metadata else _EMPTY_META
+        # テンプレートから解析したプレースホルダー集合のキャッシュ
+        # （テンプレートは構築後に変化しないため、初回解析の結果を再利用する）
+        self._placeholders: Optional[frozenset] = None
+        # テンプレートをリテラルと変数名に分割した列のキャッシュ
+        self._segments: Optional[Tuple[str, ...]] = None
+        # テンプレート専用にコンパイルされたレンダリング関数のキャッシュ
+        self._render_fn = None
+
+    def get_placeholders(self) -> Set[str]:
+        """
+        テンプレートに含まれるプレースホルダー名の集合を取得します。
+
+        戻り値:
+            Set[str]: プレースホルダー名の集合
+        """
+        if self._placeholders is None:
+            self._placeholders = frozenset(_split_template(self.template)[1::2])
+        return self._placeholders
+
+    def get_variable_names(self) -> KeysView[str]:
+        """
+        定義されている変数名のビューを取得します。
+
+        辞書のキービューを返すため、集合のコピーは発生しません。
+        呼び出し側で変更可能なスナップショットが必要な場合は
+        copy_variable_names()を使用してください。
+
+        戻り値:
+            KeysView[str]: 変数名のビュー
+        """
+        return self.variables.keys()
+
+    def copy_variable_names(self) -> Set[str]:
+        """
+        定義されている変数名の集合のコピーを取得します。
+
+        戻り値:
+            Set[str]: 変数名の集合（変更可能なコピー）
+        """
+        return set(self.variables.keys())
+
+    def add_variable(self, name: str, variable: CodeVariable) -> None:
+        """
+        変数を追加します。
+
+        引数:
+            name: 変数名
+            variable: 追加するコード変数
+        """
+        if self.variables is _EMPTY_VARS:
+            self.variables = {}
+        self.variables[name] = variable
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """変数の変更時にレンダリング関数も含めてキャッシュを破棄します。"""
+        super()._invalidate_cache()
+        self._render_fn = None
+
+    def _ensure_mutable_metadata(self) -> Dict[str, Any]:
+        """メタデータへの書き込み前に可変の辞書であることを保証します。"""
+        if type(self.metadata) is not dict:
+            self.metadata = dict(self.metadata)
+        return self.metadata
+
+    def __getstate__(self):
+        """
+        pickle用の状態を返します。
+
+        共有の読み取り専用センチネル（mappingproxy）とコンパイル済みの
+        レンダリング関数はpickleできないため、前者はNoneに置き換えて
+        復元時に共有オブジェクトへ戻し、後者は破棄します
+        （必要になった時点で再コンパイルされます）。
+        """
+        state = super().__getstate__()
+        slots = state[1]
+        if slots.get("variables") is _EMPTY_VARS:
+            slots["variables"] = None
+        if slots.get("metadata") is _EMPTY_META:
+            slots["metadata"] = None
+        slots["_render_fn"] = None
+        return state
+
+    def __setstate__(self, state):
+        """pickleされた状態を復元します（センチネルの共有も戻します）。"""
+        slots = state[1]
+        if slots.get("variables") is None:
+            slots["variables"] = _EMPTY_VARS
+        if slots.get("metadata") is None:
+            slots["metadata"] = _EMPTY_META
+        for name, value in slots.items():
+            setattr(self, name, value)
+
+    def _compile_template(self) -> None:
+        """
+        テンプレートを解析し、レンダリング関数をコンパイルします。
+
+        テンプレートに依存する処理（分割・位置解析・関数生成）を
+        すべてここで1回だけ行い、to_codeのホットパスには
+        コンパイル済み関数の呼び出しだけを残します。
+        """
+        # 分割結果は奇数番目の要素が変数名になる（テンプレートごとに共有）
+        segments = self._segments = _split_template(self.template)
+
+        # プレースホルダーのないテンプレートは定数を返す関数にする
+        if len(segments) == 1:
+            template = self.template
+            self._render_fn = lambda v: template
+            return
+
+        self._render_fn = self._build_render_fn()
+
+    def _build_render_fn(self):
+        """
+        テンプレート専用のレンダリング関数をコンパイルします。
+
+        分割済みのセグメント列を、文字列連結のみを行う関数オブジェクトに
+        変換します。全変数が数値の場合は値を直接文字列化する形に特殊化し、
+        レンダリングごとのto_code呼び出しも省略します。
+
+        戻り値:
+            Callable: 変数辞書を受け取りコード文字列を返す関数
+        """
+        segments = self._segments
+        names = segments[1::2]
+
+        # 全変数が数値リテラルであれば値の直接変換に特殊化できる
+        # （boolはto_codeでtrue/falseになるため除外する）
+        all_numeric = all(
+            name in self.variables
+            and isinstance(self.variables[name].value, (int, float))
+            and not isinstance(self.variables[name].value, bool)
+            for name in names
+        )
+
+        # 各変数はローカル変数に一度だけ評価する
+        # （同じ変数を複数回参照するテンプレートでも変換は1回で済む）
+        unique_names = list(dict.fromkeys(names))
+        if all_numeric:
+            assigns = [f"    _v_{name} = str(v[{name!r}].value)"
+                       for name in unique_names]
+        else:
+            assigns = [f"    _v_{name} = v[{name!r}].to_code()"
+                       for name in unique_names]
+
+        pieces = []
+        for i, segment in enumerate(segments):
+            if i % 2:
+                pieces.append(f"_v_{segment}")
+            elif segment:
+                pieces.append(repr(segment))
+
+        body = " + ".join(pieces) if pieces else "''"
+        source = "def _render(v):\n{}\n    return {}\n".format(
+            "\n".join(assigns), body)
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, "<code_level:render>", "exec"), namespace)
+        return namespace["_render"]
+
+    def validate(self) -> bool:
+        """
+        コードレベルの内容を検証します。
+
+        テンプレート内のすべてのプレースホルダーに対応する変数が
+        定義されていることを確認します。
+
+        戻り値:
+            bool: 内容が妥当な場合はTrue
+        """
+        if not isinstance(self.code_type, CodeType):
+            return False
+        if not isinstance(self.template, str) or not self.template:
+            return False
+
+        # プレースホルダーと変数の対応を確認（解析結果はキャッシュされる。
+        # キービューとの集合演算なので中間の集合コピーも発生しない）
+        missing = self.get_placeholders() - self.variables.keys()
+        if missing:
+            logger.warning(f"プレースホルダーに対応する変数がありません: {missing}")
+            return False
+
+        return True
+
+    def to_code(self) -> str:
+        """
+        テンプレートに変数を適用してSuperColliderコードを生成します。
+
+        戻り値:
+            str: 生成されたSuperColliderコード
+
+        例外:
+            ValidationError: コードレベルの内容が無効な場合
+        """
+        # 検証はコンパイル時に1回だけ行う（add_variableなどの変更は
+        # レンダリング関数ごとキャッシュを破棄するため、再コンパイル時に
+        # 必ず再検証される）。ホットパスにはNoneチェックと関数呼び出し
+        # だけを残す
+        if self._render_fn is None:
+            if not self.is_valid():
+                raise ValidationError(
+                    "コードレベルの内容が無効です",
+                    level=self.__class__.__name__
+                )
+            self._compile_template()
+
+        try:
+            return self._render_fn(self.variables)
+        except KeyError as e:
+            # 検証後に変数が直接削除された場合などの保険
+            raise ValidationError(
+                f"プレースホルダーに対応する変数がありません: {e}",
+                level=self.__class__.__name__
+            )
+
+    def generate_code(self) -> str:
+        """
+        SuperColliderコードを生成します（to_codeのエイリアス）。
+
+        戻り値:
+            str: 生成されたSuperColliderコード
+        """
+        return self.to_code()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        コードレベルを辞書形式に変換します。
+
+        戻り値:
+            Dict[str, Any]: 辞書形式の表現
+        """
+        return {
+            "level": "code",
+            "code_type": self.code_type.name,
+            "template": self.template,
+            "variables": {
+                name: variable.to_dict()
+                for name, variable in self.variables.items()
+            },
+            # 共有の読み取り専用マッピングを漏らさないよう通常の辞書で返す
+            "metadata": dict(self.metadata)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CodeLevel":
+        """
+        辞書形式からコードレベルを構築します。
+
+        引数:
+            data: 辞書形式の表現
+
+        戻り値:
+            CodeLevel: 構築されたコードレベル
+        """
+        code_type = _CODE_TYPE_BY_NAME.get(
+            data.get("code_type"), CodeType.UNKNOWN)
+
+        variables = {}
+        for name, variable_data in data.get("variables", {}).items():
+            variables[name] = CodeVariable.from_dict(variable_data)
+
+        return cls(
+            code_type,
+            data.get("template", ""),
+            variables,
+            data.get("metadata")
+        )
+
+    @staticmethod
+    def batch_render_sine(freqs, amps, durations) -> List[str]:
+        """
+        正弦波シンセコードを一括生成します。
+
+        CodeLevelインスタンスや変数辞書を構築せず、コンパイル済みの
+        レンダリング関数でパラメータ列を直接埋めるため、大量の
+        コード片を生成するバッチ処理に適しています。
+
+        引数:
+            freqs: 周波数（Hz）のイテラブル
+            amps: 振幅（0.0〜1.0）のイテラブル
+            durations: 持続時間（秒）のイテラブル
+
+        戻り値:
+            List[str]: 生成されたSuperColliderコードのリスト
+        """
+        # 数値の文字列化は列ごとにmapで一括して行い、
+        # 連結関数には変換済みの文字列のみを渡す
+        return [_RENDER_SINE_STR(freq, amp, duration)
+                for freq, amp, duration in zip(
+                    map(str, freqs), map(str, amps), map(str, durations))]
+
+    @classmethod
+    def _make_synth(cls, template: str, frequency: float, amplitude: float,
+                    duration: float) -> "CodeLevel":
+        """
+        シンセ系テンプレートからコードレベルを構築する共通ヘルパーです。
+
+        引数:
+            template: 使用するコードテンプレート
+            frequency: 周波数（Hz）
+            amplitude: 振幅（0.0〜1.0）
+            duration: 持続時間（秒）
+
+        戻り値:
+            CodeLevel: 作成されたコードレベル
+        """
+        return cls(CodeType.SYNTH, template, {
+            "freq": CodeVariable("freq", frequency),
+            "amp": CodeVariable("amp", amplitude),
+            "duration": CodeVariable("duration", duration)
+        })
+
+    @classmethod
+    def create_sine_synth(cls, frequency: float = 440.0, amplitude: float = 0.5,
+                          duration: float = 1.0) -> "CodeLevel":
+        """
+        正弦波シンセのコードレベルを作成します。
+
+        引数:
+            frequency: 周波数（Hz）
+            amplitude: 振幅（0.0〜1.0）
+            duration: 持続時間（秒）
+
+        戻り値:
+            CodeLevel: 作成されたコードレベル
+        """
+        return cls._make_synth(_SINE_TEMPLATE, frequency, amplitude, duration)
+
+    @classmethod
+    def create_saw_synth(cls, frequency: float = 440.0, amplitude: float = 0.5,
+                         duration: float = 1.0) -> "CodeLevel":
+        """
+        ノコギリ波シンセのコードレベルを作成します。
+
+        引数:
+            frequency: 周波数（Hz）
+            amplitude: 振幅（0.0〜1.0）
+            duration: 持続時間（秒）
+
+        戻り値:
+            CodeLevel: 作成されたコードレベル
+        """
+        return cls._make_synth(_SAW_TEMPLATE, frequency, amplitude, duration)
+
+    @classmethod
+    def create_square_synth(cls, frequency: float = 440.0, amplitude: float = 0.5,
+                            duration: float = 1.0) -> "CodeLevel":
+        """
+        矩形波シンセのコードレベルを作成します。
+
+        引数:
+            frequency: 周波数（Hz）
+            amplitude: 振幅（0.0〜1.0）
+            duration: 持続時間（秒）
+
+        戻り値:
+            CodeLevel: 作成されたコードレベル
+        """
+        return cls._make_synth(_SQUARE_TEMPLATE, frequency, amplitude, duration)
@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SPACO - 表現レベル間の変換
+
+このモジュールは、異なる表現レベル（意図、パラメータ、構造、コード）間の
+変換を行うクラスを提供します。各変換器は1つのレベルを受け取り、
+次のレベルの表現を構築します。
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Optional
+import re
+
+from .base import RepresentationLevel
+from .intent_level import IntentLevel, IntentType, INTENT_TYPE_NAMES
+from .parameter_level import ParameterLevel, ParameterValue
+from .structure_level import (StructureLevel, StructureComponent,
+                              StructureType, STRUCTURE_TYPE_NAMES)
+from .code_level import CodeLevel, CodeVariable, CodeType
+
+# 波形キーワード → 正規化された波形名の対応表
+# （意図→パラメータ変換と構造→コード変換で共有する語彙。
+# 正規表現もモジュールロード時に1回だけコンパイルする）
+WAVEFORM_ALIASES: Dict[str, str] = {
+    "正弦波": "sine",
+    "sine": "sine",
+    "ノコギリ波": "saw",
+    "saw": "saw",
+    "矩形波": "square",
+    "square": "square",
+    "三角波": "triangle",
+    "triangle": "triangle",
+}
+WAVEFORM_RE = re.compile(
+    "|".join(map(re.escape, WAVEFORM_ALIASES)), re.IGNORECASE)
+
+# 説明文中の周波数表記（例: "440Hz"）の正規表現
+# （モジュールロード時に1回だけコンパイルし、変換ごとのreモジュールの
+# キャッシュ参照を省く）
+_FREQ_RE = re.compile(r"(\d+(?:\.\d+)?)\s*Hz", re.IGNORECASE)
+
+# 全構造で共有する出力コンポーネント
+# （値が固定のため変換のたびに生成せず、1つのインスタンスを使い回す。
+# 変換パイプラインはコンポーネントを書き換えない）
+_OUTPUT_COMPONENT = StructureComponent("output", "output", None, {"channels": 2})
+
+# 構造タイプ → コードタイプの対応表
+# （変換のたびに辞書を構築しないようモジュールロード時に1回だけ定義する）
+_STRUCTURE_TO_CODE_TYPE: Dict[StructureType, CodeType] = {
+    StructureType.SYNTH: CodeType.SYNTH,
+    StructureType.EFFECT_CHAIN: CodeType.EFFECT_CHAIN,
+    StructureType.SEQUENCE: CodeType.SEQUENCE,
+    StructureType.INSTRUMENT: CodeType.INSTRUMENT,
+}
+
+
+class ConversionError(Exception):
+    """表現レベル間の変換に関するエラー"""
+
+    __slots__ = ("source_level", "target_level", "original_exception",
+                 "details")
+
+    def __init__(self, message, source_level=None, target_level=None,
+                 original_exception=None, details=None):
+        super().__init__(message)
+        self.source_level = source_level
+        self.target_level = target_level
+        self.original_exception = original_exception
+        self.details = details or {}
+
+
+class BaseConverter(ABC):
+    """
+    表現レベル変換器の抽象基底クラス
+
+    入力の検証と変換エラーの共通処理を提供します。
+    サブクラスは_convert_implで実際の変換を実装します。
+    """
+
+    # 固定スロットにして変換器インスタンスの__dict__を省く
+    # （サブクラスも自身の属性を__slots__で宣言すること）
+    __slots__ = ()
+
+    # 入力として期待する表現レベルのクラス（サブクラスで上書き）
+    source_level_class = RepresentationLevel
+
+    def _validate_input(self, level: RepresentationLevel) -> None:
+        """
+        入力の表現レベルを検証します。
+
+        引数:
+            level: 検証する表現レベル
+
+        例外:
+            ConversionError: 入力が不正な場合
+        """
+        if not isinstance(level, self.source_level_class):
+            raise ConversionError(
+                f"入力の型が不正です: {type(level).__name__}",
+                source_level=type(level).__name__
+            )
+        if not level.is_valid():
+            raise ConversionError(
+                "入力の表現レベルの検証に失敗しました",
+                source_level=type(level).__name__
+            )
+
+    def convert(self, level: RepresentationLevel) -> RepresentationLevel:
+        """
+        表現レベルを次のレベルに変換します。
+
+        引数:
+            level: 変換元の表現レベル
+
+        戻り値:
+            RepresentationLevel: 変換された表現レベル
+
+        例外:
+            ConversionError: 変換中にエラーが発生した場合
+        """
+        self._validate_input(level)
+
+        try:
+            return self._convert_impl(level)
+        except ConversionError:
+            raise
+        except Exception as e:
+            raise ConversionError(
+                f"変換中にエラーが発生しました: {str(e)}",
+                source_level=type(level).__name__,
+                original_exception=e
+            )
+
+    @abstractmethod
+    def _convert_impl(self, level: RepresentationLevel) -> RepresentationLevel:
+        """変換処理の実装（サブクラスで定義）。"""
+        raise NotImplementedError
+
+
+class IntentToParameterConverter(BaseConverter):
+    """
+    意図レベルからパラメータレベルへの変換クラス
+
+    意図のメタデータと説明文からパラメータを抽出し、
+    意図タイプごとのデフォルトパラメータで補完します。
+    """
+
+    __slots__ = ("default_parameters", "_default_param_values")
+
+    source_level_class = IntentLevel
+
+    # 意図タイプごとのデフォルトパラメータ
+    DEFAULT_PARAMETERS: Dict[IntentType, Dict[str, Dict[str, Any]]] = {
+        IntentType.GENERATE_SOUND: {
+            "frequency": {"value_type": "static", "value": 440.0, "unit": "Hz"},
+            "amplitude": {"value_type": "static", "value": 0.5},
+            "duration": {"value_type": "static", "value": 1.0, "unit": "sec"},
+            "waveform": {"value_type": "static", "value": "sine"},
+        },
+        IntentType.APPLY_EFFECT: {
+            "effect_type": {"value_type": "static", "value": "reverb"},
+            "mix": {"value_type": "static", "value": 0.5},
+            "duration": {"value_type": "static", "value": 1.0, "unit": "sec"},
+        },
+        IntentType.CREATE_SEQUENCE: {
+            "tempo": {"value_type": "static", "value": 120, "unit": "bpm"},
+            "steps": {"value_type": "static", "value": 8},
+            "duration": {"value_type": "static", "value": 4.0, "unit": "sec"},
+        },
+        IntentType.CREATE_MELODY: {
+            "scale": {"value_type": "static", "value": "major"},
+            "tempo": {"value_type": "static", "value": 120, "unit": "bpm"},
+            "length": {"value_type": "static", "value": 8},
+        },
+        IntentType.GENERATE_INSTRUMENT: {
+            "instrument_type": {"value_type": "static", "value": "keyboard"},
+            "frequency": {"value_type": "static", "value": 440.0, "unit": "Hz"},
+            "amplitude": {"value_type": "static", "value": 0.5},
+        },
+    }
+
+    def __init__(self, default_parameters: Optional[Dict[IntentType, Dict[str, Dict[str, Any]]]] = None):
+        """
+        意図からパラメータへの変換クラスを初期化します。
+
+        引数:
+            default_parameters: 意図タイプごとのデフォルトパラメータ
+                （Noneの場合はクラス定義のデフォルトを使用）
+        """
+        # BaseConverterは状態を持たないため、super().__init__()は呼ばない
+        # （メモ化サブクラスのひし形継承でMemoizedConverter.__init__が
+        # MRO経由で二重に実行されるのを防ぐ）
+        self.default_parameters = default_parameters or self.DEFAULT_PARAMETERS
+
+        # 意図タイプごとのデフォルトParameterValueを事前構築する
+        # （変換のたびの仕様辞書の.get連鎖とインスタンス生成を省く。
+        # 変換パイプラインはParameterValueを書き換えないため共有で問題ない）
+        self._default_param_values: Dict[IntentType, Dict[str, ParameterValue]] = {
+            intent_type: {
+                name: ParameterValue(
+                    spec.get("value_type", "static"),
+                    spec.get("value"),
+                    spec.get("unit")
+                )
+                for name, spec in params.items()
+            }
+            for intent_type, params in self.default_parameters.items()
+        }
+
+    def _convert_impl(self, intent: IntentLevel) -> ParameterLevel:
+        """
+        意図レベルからパラメータレベルへの変換を実装します。
+
+        引数:
+            intent: 意図レベルの表現
+
+        戻り値:
+            ParameterLevel: 変換されたパラメータレベルの表現
+        """
+        parameters: Dict[str, ParameterValue] = {}
+
+        # メタデータに抽出済みパラメータがあれば取り込む
+        # （type()の完全一致チェックと.getの一括参照で辞書プローブを減らす）
+        metadata = intent.metadata
+        extracted = metadata.get("extracted_parameters") \
+            if type(metadata) is dict else None
+        if type(extracted) is dict:
+            for name, spec in extracted.items():
+                if type(spec) is not dict:
+                    continue
+                value = spec.get("value")
+                if value is not None:
+                    parameters[name] = ParameterValue(
+                        spec.get("value_type", "static"),
+                        value,
+                        spec.get("unit")
+                    )
+
+        # 説明文から周波数を抽出
+        match = _FREQ_RE.search(intent.description)
+        if match and "frequency" not in parameters:
+            parameters["frequency"] = ParameterValue(
+                "static", float(match.group(1)), "Hz")
+
+        # 説明文から波形キーワードを検出（全キーワードを1回の走査で照合）
+        if "waveform" not in parameters:
+            match = WAVEFORM_RE.search(intent.description)
+            if match:
+                waveform = WAVEFORM_ALIASES[match.group(0).lower()]
+                parameters["waveform"] = ParameterValue("static", waveform)
+
+        # 意図タイプごとのデフォルトパラメータで補完（事前構築した値を共有。
+        # 欠けているキーの算出はキービューの差集合1回で済ませる）
+        defaults = self._default_param_values.get(intent.intent_type)
+        if defaults:
+            for name in defaults.keys() - parameters.keys():
+                parameters[name] = defaults[name]
+
+        return ParameterLevel(parameters, INTENT_TYPE_NAMES[intent.intent_type])
+
+
+class ParameterToStructureConverter(BaseConverter):
+    """
+    パラメータレベルから構造レベルへの変換クラス
+
+    パラメータセットに最も適合する構造テンプレートを選択し、
+    コンポーネントと接続からなる構造を構築します。
+    """
+
+    __slots__ = ("structure_templates", "_select_cache", "_param_vocab",
+                 "_template_index")
+
+    source_level_class = ParameterLevel
+
+    # 構造テンプレート（必須・任意パラメータとの適合度で選択される）
+    STRUCTURE_TEMPLATES: List[Dict[str, Any]] = [
+        {
+            "name": "basic_synth",
+            "structure_type": StructureType.SYNTH,
+            "required_parameters": ["frequency"],
+            "optional_parameters": ["amplitude", "duration", "waveform"],
+        },
+        {
+            "name": "effect_chain",
+            "structure_type": StructureType.EFFECT_CHAIN,
+            "required_parameters": ["effect_type"],
+            "optional_parameters": ["mix", "duration"],
+        },
+        {
+            "name": "sequence",
+            "structure_type": StructureType.SEQUENCE,
+            "required_parameters": ["tempo", "steps"],
+            "optional_parameters": ["duration"],
+        },
+        {
+            "name": "instrument",
+            "structure_type": StructureType.INSTRUMENT,
+            "required_parameters": ["instrument_type"],
+            "optional_parameters": ["frequency", "amplitude"],
+        },
+    ]
+
+    def __init__(self, structure_templates: Optional[List[Dict[str, Any]]] = None):
+        """
+        パラメータから構造への変換クラスを初期化します。
+
+        引数:
+            structure_templates: 構造テンプレートのリスト
+                （Noneの場合はクラス定義のテンプレートを使用）
+        """
+        self.structure_templates = structure_templates or self.STRUCTURE_TEMPLATES
+
+        # テンプレート選択結果のキャッシュ
+        # （一括変換では同じパラメータ構成が繰り返し現れるため、
+        # パラメータ名の集合をキーにスコアリングの再計算を省く。
+        # 挿入順を利用したLRUとして運用する）
+        self._select_cache: Dict[frozenset, Dict[str, Any]] = {}
+
+        # パラメータ名 → ビット値の語彙表
+        # （テンプレートに現れる全パラメータ名に固定のビットを割り当て、
+        # スコアリングを集合演算から整数のAND + popcountに置き換える。
+        # 語彙にない名前はどのテンプレートにも一致しないため無視してよい）
+        self._param_vocab: Dict[str, int] = {}
+        for template in self.structure_templates:
+            for name in (template["required_parameters"]
+                         + template["optional_parameters"]):
+                if name not in self._param_vocab:
+                    self._param_vocab[name] = 1 << len(self._param_vocab)
+
+        # スコアリング用のテンプレート索引
+        # （必須・任意パラメータのビットマスクを初期化時に1回だけ構築し、
+        # 選択ループでの辞書参照と集合生成を省く。各テンプレートの
+        # スコア上限で降順に並べておくことで、上限に達した時点での
+        # 打ち切りと、残りが最高スコアに届かない場合の早期終了ができる）
+        self._template_index = []
+        for template in self.structure_templates:
+            req_mask = self._names_to_mask(template["required_parameters"])
+            opt_mask = self._names_to_mask(template["optional_parameters"])
+            ceiling = 2 * req_mask.bit_count() + opt_mask.bit_count()
+            self._template_index.append((req_mask, opt_mask, ceiling, template))
+        self._template_index.sort(key=lambda entry: -entry[2])
+
+    def _names_to_mask(self, names) -> int:
+        """パラメータ名の列を語彙表に基づくビットマスクに変換します。"""
+        mask = 0
+        vocab = self._param_vocab
+        for name in names:
+            bit = vocab.get(name)
+            if bit is not None:
+                mask |= bit
+        return mask
+
+    # テンプレート選択キャッシュの上限エントリ数
+    _SELECT_CACHE_CAP = 1024
+
+    def clear_select_cache(self) -> None:
+        """テンプレート選択キャッシュをクリアします。"""
+        self._select_cache.clear()
+
+    def _select_template(self, param_names: frozenset) -> Dict[str, Any]:
+        """
+        パラメータ名の集合に最も適合する構造テンプレートを選択します。
+
+        必須パラメータの一致は2点、任意パラメータの一致は1点として
+        スコア付けし、必須パラメータが欠けているテンプレートは除外します。
+        同じパラメータ名の集合に対する選択結果はキャッシュされます。
+
+        引数:
+            param_names: パラメータ名のfrozenset
+
+        戻り値:
+            Dict[str, Any]: 選択された構造テンプレート
+        """
+        cached = self._select_cache.pop(param_names, None)
+        if cached is not None:
+            # ヒットしたエントリを末尾に移動してLRU順を維持する
+            self._select_cache[param_names] = cached
+            return cached
+
+        present_mask = self._names_to_mask(param_names)
+
+        best_template = None
+        best_score = -1
+
+        for req_mask, opt_mask, ceiling, template in self._template_index:
+            # 降順に並んでいるため、残りの上限が現在の最高スコアを
+            # 超えられなければ走査を打ち切れる
+            if ceiling <= best_score:
+                break
+
+            # 必須パラメータが欠けているテンプレートは除外
+            if req_mask & present_mask != req_mask:
+                continue
+
+            score = (2 * req_mask.bit_count()
+                     + (opt_mask & present_mask).bit_count())
+            if score > best_score:
+                best_score = score
+                best_template = template
+                # 上限に達したテンプレートはこれ以上改善できない
+                if score == ceiling:
+                    break
+
+        # 適合するテンプレートがない場合は最初のテンプレートを使用
+        if best_template is None:
+            best_template = self.structure_templates[0]
+
+        if len(self._select_cache) >= self._SELECT_CACHE_CAP:
+            self._select_cache.pop(next(iter(self._select_cache)))
+        self._select_cache[param_names] = best_template
+
+        return best_template
+
+    def _convert_impl(self, param_level: ParameterLevel) -> StructureLevel:
+        """
+        パラメータレベルから構造レベルへの変換を実装します。
+
+        引数:
+            param_level: パラメータレベルの表現
+
+        戻り値:
+            StructureLevel: 変換された構造レベルの表現
+        """
+        # パラメータ名の列挙は1回だけ行い、選択と記録の両方で使い回す
+        param_dict = param_level.parameters
+        param_names = frozenset(param_dict)
+
+        template = self._select_template(param_names)
+        structure_type = template["structure_type"]
+
+        # テンプレートのパラメータをコンポーネント化
+        # （存在確認と取得を1回の辞書参照にまとめる）
+        components: Dict[str, StructureComponent] = {}
+        for name in template["required_parameters"] + template["optional_parameters"]:
+            parameter = param_dict.get(name)
+            if parameter is not None:
+                metadata = {"unit": parameter.unit} if parameter.unit else {}
+                components[name] = StructureComponent(
+                    "parameter", name, parameter.value, metadata)
+
+        # 出力コンポーネントを追加（共有インスタンス）
+        components["output"] = _OUTPUT_COMPONENT
+
+        # 各パラメータコンポーネントを出力に接続
+        connections = []
+        for name in components:
+            if name != "output":
+                connections.append((name, "output"))
+
+        # 元となったパラメータ名を記録（辞書の反復はC実装のキー列挙。
+        # 不変のタプルにしておくことで下流のキャッシュキーにも使える）
+        source_parameters = tuple(param_dict)
+
+        metadata = {
+            "template": template["name"],
+            "source_intent": param_level.source_intent
+        }
+
+        return StructureLevel(
+            structure_type, components, connections, source_parameters, metadata)
+
+
+class StructureToCodeConverter(BaseConverter):
+    """
+    構造レベルからコードレベルへの変換クラス
+
+    構造の種類に応じたコードテンプレートを選択し、
+    コンポーネントの値をコード変数として埋め込みます。
+    """
+
+    __slots__ = ("code_templates", "_oscillator_exprs", "_synth_templates")
+
+    source_level_class = StructureLevel
+
+    # 構造タイプごとのコードテンプレート
+    # SYNTHテンプレートの__UGEN__は波形に応じたオシレーター式に置換される
+    CODE_TEMPLATES: Dict[StructureType, str] = {
+        StructureType.SYNTH: """s.waitForBoot({
+    {
+        var sig = __UGEN__;
+        sig = sig * EnvGen.kr(Env.linen(0.01, {{duration}}, 0.01), doneAction: 2);
+        sig ! 2
+    }.play;
+});""",
+        StructureType.EFFECT_CHAIN: """s.waitForBoot({
+    {
+        var sig = In.ar(0, 2);
+        sig = FreeVerb.ar(sig, {{mix}}, 0.8, 0.5);
+        sig
+    }.play;
+});""",
+        StructureType.SEQUENCE: """s.waitForBoot({
+    Pbind(
+        \\degree, Pseq((0..{{steps}}), inf),
+        \\dur, 60 / {{tempo}}
+    ).play;
+});""",
+        StructureType.INSTRUMENT: """s.waitForBoot({
+    SynthDef(\\spacoInstrument, { |freq = {{freq}}, amp = {{amp}}|
+        var sig = SinOsc.ar(freq, 0, amp);
+        Out.ar(0, sig ! 2);
+    }).add;
+});""",
+    }
+
+    # プレースホルダーのデフォルト値（コンポーネントに値がない場合に使用）
+    PLACEHOLDER_DEFAULTS: Dict[str, Any] = {
+        "freq": 440.0,
+        "amp": 0.5,
+        "duration": 1.0,
+        "mix": 0.5,
+        "steps": 8,
+        "tempo": 120,
+    }
+
+    # パラメータ名 → プレースホルダー名の対応
+    PARAMETER_TO_PLACEHOLDER: Dict[str, str] = {
+        "frequency": "freq",
+        "amplitude": "amp",
+    }
+
+    def __init__(self, code_templates: Optional[Dict[StructureType, str]] = None):
+        """
+        構造からコードへの変換クラスを初期化します。
+
+        引数:
+            code_templates: 構造タイプごとのコードテンプレート
+                （Noneの場合はクラス定義のテンプレートを使用）
+        """
+        self.code_templates = code_templates or self.CODE_TEMPLATES
+
+        # 波形名 → オシレーター式の対応表
+        self._oscillator_exprs = {
+            "sine": "SinOsc.ar({{freq}}, 0, {{amp}})",
+            "saw": "Saw.ar({{freq}}, {{amp}})",
+            "square": "Pulse.ar({{freq}}, 0.5, {{amp}})",
+            "triangle": "LFTri.ar({{freq}}, 0, {{amp}})",
+        }
+
+        # 波形名 → オシレーター式を埋め込み済みのSYNTHテンプレート
+        # （変換のたびのstr.replaceを省き、テンプレート文字列を波形ごとに
+        # 共有する。共有によりCodeLevel側の分割キャッシュにも乗りやすい）
+        synth_template = self.code_templates.get(StructureType.SYNTH)
+        if synth_template and "__UGEN__" in synth_template:
+            self._synth_templates = {
+                waveform: synth_template.replace("__UGEN__", expr)
+                for waveform, expr in self._oscillator_exprs.items()
+            }
+        else:
+            self._synth_templates = {}
+
+    def _convert_impl(self, structure: StructureLevel) -> CodeLevel:
+        """
+        構造レベルからコードレベルへの変換を実装します。
+
+        引数:
+            structure: 構造レベルの表現
+
+        戻り値:
+            CodeLevel: 変換されたコードレベルの表現
+        """
+        code_type = _STRUCTURE_TO_CODE_TYPE.get(
+            structure.structure_type, CodeType.RAW)
+
+        template = self.code_templates.get(
+            structure.structure_type,
+            self.code_templates[StructureType.SYNTH]
+        )
+
+        # SYNTHテンプレートの場合、波形に応じたオシレーター式を埋め込む
+        # （通常は初期化時に構築した埋め込み済みテンプレートを流用する）
+        if "__UGEN__" in template:
+            waveform_component = structure.components.get("waveform")
+            waveform = (waveform_component.value
+                        if waveform_component is not None else "sine")
+            waveform = WAVEFORM_ALIASES.get(waveform, waveform)
+            prebuilt = self._synth_templates.get(
+                waveform, self._synth_templates.get("sine"))
+            if prebuilt is not None:
+                template = prebuilt
+            else:
+                oscillator = self._oscillator_exprs.get(
+                    waveform, self._oscillator_exprs["sine"])
+                template = template.replace("__UGEN__", oscillator)
+
+        # コンポーネントの値をコード変数として収集
+        variables: Dict[str, CodeVariable] = {}
+        for name, component in structure.components.items():
+            if component.component_type != "parameter":
+                continue
+            placeholder = self.PARAMETER_TO_PLACEHOLDER.get(name, name)
+            variables[placeholder] = CodeVariable(placeholder, component.value)
+
+        # テンプレートのプレースホルダーに対応する変数がない場合は
+        # デフォルト値で補完する
+        for placeholder in re.findall(r"\{\{(\w+)\}\}", template):
+            if placeholder not in variables:
+                variables[placeholder] = CodeVariable(
+                    placeholder, self.PLACEHOLDER_DEFAULTS.get(placeholder, 0))
+
+        metadata = {
+            "structure_type": STRUCTURE_TYPE_NAMES[structure.structure_type],
+            "template": structure.metadata.get("template")
+        }
+
+        return CodeLevel(code_type, template, variables, metadata)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SPACO - 意図レベルの表現
+
+このモジュールは、自然言語指示から抽出された「意図」を表す
+表現レベルを提供します。意図は変換パイプラインの最初の段階です。
+"""
+
+from enum import Enum, auto
+from typing import Dict, Any, FrozenSet, Optional
+
+from .base import RepresentationLevel
+
+
+class IntentType(Enum):
+    """意図の種類"""
+    GENERATE_SOUND = auto()       # 音の生成
+    APPLY_EFFECT = auto()         # エフェクトの適用
+    CREATE_SEQUENCE = auto()      # シーケンスの作成
+    CREATE_MELODY = auto()        # メロディの作成
+    GENERATE_INSTRUMENT = auto()  # 楽器の生成
+    UNKNOWN = auto()              # 不明な意図
+
+
+# メンバー → 名前文字列の対応表
+# （.nameはディスクリプタ経由の参照になるため、ホットパスでは
+# この表を引く方が速い）
+INTENT_TYPE_NAMES: Dict[IntentType, str] = {t: t.name for t in IntentType}
+
+# 意図タイプ → 関連パラメータ名の対応表
+# （呼び出しごとのset生成を避けるため、共有のfrozensetとして
+# モジュールロード時に1回だけ構築する）
+_RELATED_PARAMETERS: Dict[IntentType, FrozenSet[str]] = {
+    IntentType.GENERATE_SOUND: frozenset(
+        ("frequency", "amplitude", "duration", "waveform")),
+    IntentType.APPLY_EFFECT: frozenset(("effect_type", "mix", "duration")),
+    IntentType.CREATE_SEQUENCE: frozenset(("tempo", "steps", "duration")),
+    IntentType.CREATE_MELODY: frozenset(("scale", "tempo", "length")),
+    IntentType.GENERATE_INSTRUMENT: frozenset(
+        ("instrument_type", "frequency", "amplitude")),
+}
+_RELATED_PARAMETERS_DEFAULT: FrozenSet[str] = frozenset()
+
+
+class IntentLevel(RepresentationLevel):
+    """
+    意図レベルの表現クラス
+
+    自然言語指示から抽出された意図の種類、元の指示文、
+    抽出されたメタデータ、および確信度を保持します。
+    """
+
+    __slots__ = ("intent_type", "description", "metadata", "confidence")
+
+    def __init__(self, intent_type: IntentType, description: str,
+                 metadata: Optional[Dict[str, Any]] = None,
+                 confidence: float = 1.0):
+        """
+        意図レベルの表現を初期化します。
+
+        引数:
+            intent_type: 意図の種類
+            description: 意図の元となった指示文
+            metadata: 抽出されたメタデータ（オプション）
+            confidence: 意図認識の確信度（0.0〜1.0）
+        """
+        super().__init__()
+        self.intent_type = intent_type
+        self.description = description
+        self.metadata = metadata or {}
+        self.confidence = confidence
+
+    def validate(self) -> bool:
+        """
+        意図レベルの内容を検証します。
+
+        変換のたびに呼ばれるため、サブクラスを考慮しないtype()の
+        完全一致チェックでisinstanceのMRO走査を省いています。
+
+        戻り値:
+            bool: 内容が妥当な場合はTrue
+        """
+        if type(self.intent_type) is not IntentType:
+            return False
+        description = self.description
+        if type(description) is not str or not description:
+            return False
+        if type(self.metadata) is not dict:
+            return False
+        return 0.0 <= self.confidence <= 1.0
+
+    def get_related_parameters(self) -> FrozenSet[str]:
+        """
+        この意図の種類に関連するパラメータ名の集合を返します。
+
+        戻り値:
+            FrozenSet[str]: 関連するパラメータ名の集合（共有オブジェクト）
+        """
+        return _RELATED_PARAMETERS.get(
+            self.intent_type, _RELATED_PARAMETERS_DEFAULT)
+
+    def set_metadata(self, key: str, value: Any) -> None:
+        """
+        メタデータを設定します（内部キャッシュは破棄されます）。
+
+        引数:
+            key: メタデータのキー
+            value: メタデータの値
+        """
+        self.metadata[key] = value
+        self._invalidate_cache()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        意図レベルを辞書形式に変換します。
+
+        内部の辞書は初回に1回だけ構築され、以降の呼び出しでは
+        その浅いコピーを返します（コピーはキーごとの再構築より高速で、
+        呼び出し側の変更から内部キャッシュを守ります）。
+
+        戻り値:
+            Dict[str, Any]: 辞書形式の表現
+        """
+        cache = self._dict_cache
+        if cache is None:
+            cache = self._dict_cache = {
+                "level": "intent",
+                "intent_type": INTENT_TYPE_NAMES[self.intent_type],
+                "description": self.description,
+                "metadata": self.metadata,
+                "confidence": self.confidence
+            }
+        return dict(cache)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IntentLevel":
+        """
+        辞書形式から意図レベルを構築します。
+
+        引数:
+            data: 辞書形式の表現
+
+        戻り値:
+            IntentLevel: 構築された意図レベル
+        """
+        try:
+            intent_type = IntentType[data["intent_type"]]
+        except (KeyError, TypeError):
+            intent_type = IntentType.UNKNOWN
+
+        return cls(
+            intent_type,
+            data.get("description", ""),
+            data.get("metadata"),
+            data.get("confidence", 1.0)
+        )
@@ -8,10 +8,18 @@ SPACO - 最適化された表現レベル間の変換
 変換を行うクラスの最適化版を提供します。
 """
 
-from typing import Dict, Any, List, Optional, Set, Union, Tuple, Callable
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Union, Tuple, Callable
 import logging
 import functools
-import time
+import operator
+import pickle
+
+# orjsonが利用可能な場合はキャッシュキーの生成に使用する
+# （C実装の直列化はPythonレベルの木の走査よりはるかに高速）
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .base import ValidationError
 from .intent_level import IntentLevel, IntentType
@@ -25,96 +33,234 @@ from .converter import (
 
 logger = logging.getLogger(__name__)
 
+# 統計が無効な場合に毎回返す共有の読み取り専用辞書
+_STATS_DISABLED = {"enabled": False}
+
+
+def _hash_dict(value: Dict) -> FrozenSet:
+    """
+    辞書を(キー, 値)ペアのfrozensetに変換します。
+
+    ソート済みタプルと違い構築がO(N)で済み、さらにCPythonは
+    frozensetのハッシュ値をオブジェクト側にキャッシュするため、
+    キャッシュキーとしての再ハッシュがO(1)になります。
+    """
+    return frozenset((k, _make_hashable(v)) for k, v in value.items())
+
+
+def _hash_list(value: List) -> Tuple:
+    """リストを要素順を保ったタプルに変換します。"""
+    return tuple(_make_hashable(v) for v in value)
+
+
+def _hash_set(value: Set) -> FrozenSet:
+    """集合をハッシュ可能化した要素のfrozensetに変換します。"""
+    return frozenset(_make_hashable(v) for v in value)
+
+
+# コンテナ型 → ハッシュ可能化関数の対応表
+# （type()による完全一致で引くため、isinstanceの連鎖より高速。
+# 表にない型＝リーフ値は1回の辞書参照だけで素通しになる）
+_HASHERS = {dict: _hash_dict, list: _hash_list, set: _hash_set}
+
+# ソートキー用：タプルの先頭要素（名前）を取り出す
+_first_item = operator.itemgetter(0)
+
+
+class _HashedKey:
+    """
+    ハッシュ値をメモ化するキャッシュキーのラッパー
+
+    複合キータプルのハッシュ計算は全要素を走査するため、
+    深い構造では辞書参照のたびに無視できないコストになります。
+    初回のhash()の結果を保持することで、同じキーの2回目以降の
+    参照（LRUのpop/再挿入を含む）をO(1)にします。
+    """
+
+    __slots__ = ("key", "_h")
+
+    def __init__(self, key: Tuple):
+        self.key = key
+        self._h: Optional[int] = None
+
+    def __hash__(self) -> int:
+        h = self._h
+        if h is None:
+            h = self._h = hash(self.key)
+        return h
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is _HashedKey and self.key == other.key
+
+    def __getstate__(self):
+        # 文字列ハッシュはプロセスごとにソルトされるため、
+        # メモ化したハッシュ値はpickleに含めない
+        return self.key
+
+    def __setstate__(self, key):
+        self.key = key
+        self._h = None
+
+
+def _make_hashable(value: Any) -> Any:
+    """
+    値をハッシュ可能なものに変換します。
+
+    辞書・リスト・集合は再帰的にタプル化し、それ以外の値は
+    そのまま返します。ネストした辞書を含むメタデータ
+    （例: extracted_parameters）もキャッシュキーに使用できます。
+
+    引数:
+        value: 変換する値
+
+    戻り値:
+        Any: ハッシュ可能な値
+    """
+    hasher = _HASHERS.get(type(value))
+    return hasher(value) if hasher is not None else value
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_component_flattener(names: FrozenSet[str]) -> Callable:
+    """
+    コンポーネント集合専用の平坦化関数をコンパイルします。
+
+    構造のコンポーネント名の集合はテンプレートごとにほぼ固定なので、
+    初出の集合に対して名前をリテラルとして埋め込んだ専用関数を生成し、
+    以降の呼び出しではソートとジェネレータの駆動を省きます
+    （CodeLevelの_render_fnと同じ部分評価の発想です）。
+
+    引数:
+        names: コンポーネント名の集合
+
+    戻り値:
+        Callable: components辞書を受け取りソート済みタプル列を返す関数
+    """
+    assigns = []
+    parts = []
+    for i, name in enumerate(sorted(names)):
+        assigns.append(f"    c{i} = components[{name!r}]")
+        parts.append(
+            f"        ({name!r}, c{i}.component_type, c{i}.name,"
+            f" _mh(c{i}.value),"
+            f" _mh(c{i}.metadata) if c{i}.metadata else ()),")
+    source = (
+        "def _flatten(components, _mh=_make_hashable):\n"
+        + "\n".join(assigns)
+        + "\n    return (\n"
+        + "\n".join(parts)
+        + "\n    )\n"
+    )
+    namespace = {"_make_hashable": _make_hashable}
+    exec(compile(source, "<component_flattener>", "exec"), namespace)
+    return namespace["_flatten"]
+
 
 class MemoizedConverter(BaseConverter):
     """
     メモ化（キャッシュ）機能を持つ基底コンバータークラス
-    
+
     このクラスは、変換処理の結果をキャッシュすることで、
     同じ入力に対する処理を高速化します。
+    キャッシュはロックを持たないため、スレッドセーフではありません。
     """
-    
-    def __init__(self, cache_size: int = 128, cache_stats: bool = False):
+
+    def __init__(self, cache_size: Optional[int] = 128,
+                 cache_stats: bool = False):
         """
         メモ化コンバーターを初期化します。
-        
+
         引数:
-            cache_size: キャッシュの最大サイズ
-            cache_stats: キャッシュの統計情報を収集するかどうか
+            cache_size: キャッシュの最大サイズ（Noneの場合は無制限で、
+                変換ごとのサイズ確認と追い出し処理を省略する）
+            cache_stats: キャッシュの統計情報を報告するかどうか
         """
         super().__init__()
         self.cache_size = cache_size
         self.cache_stats = cache_stats
-        self.cache_hits = 0
-        self.cache_misses = 0
-        self.total_time_saved = 0.0
-    
-    def _memoize_function(self, func: Callable) -> Callable:
+        # 変換結果のキャッシュ（挿入順を利用したLRUとして運用する）
+        self._cache: Dict[Any, Any] = {}
+        # 直前の入力と結果を保持する1スロットのL1キャッシュ
+        # （同じオブジェクトの連続変換ではポインタ比較1回で済む）
+        self._last_input: Any = None
+        self._last_result: Any = None
+        self._hits = 0
+        self._misses = 0
+        # テンプレート世代番号。キャッシュキーの先頭に付与されるため、
+        # 更新前の世代のエントリには二度と到達できなくなる
+        self._template_version = 0
+
+    def _memoized_convert(self, key: Any, level: Any) -> Any:
         """
-        関数をメモ化（キャッシュ）するラッパー関数を返します。
-        
+        キャッシュを参照し、ミス時のみ実際の変換を実行します。
+
+        呼び出し元が保持している元のオブジェクトをそのまま
+        変換処理に渡すため、ミス時にキーからオブジェクトグラフを
+        再構築する必要がありません。
+
         引数:
-            func: メモ化する関数
-            
+            key: 構造から導出されたハッシュ可能なキャッシュキー
+            level: 変換元の表現レベル（元のオブジェクト）
+
         戻り値:
-            Callable: メモ化された関数
-        """
-        @functools.lru_cache(maxsize=self.cache_size)
-        def cached_func(*args, **kwargs):
-            if self.cache_stats:
-                start_time = time.time()
-                
-            result = func(*args, **kwargs)
-            
-            if self.cache_stats:
-                self.cache_misses += 1
-                
-            return result
-        
-        def wrapper(*args, **kwargs):
-            # キャッシュされた関数を呼び出す前に、キャッシュヒットを判定
-            if self.cache_stats:
-                # LRU_cacheはキャッシュヒットを直接確認する方法がないため、
-                # 処理時間を測定して推測する
-                start_time = time.time()
-                result = cached_func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                
-                # 処理時間が極端に短い場合はキャッシュヒットと判断
-                if elapsed < 0.001:  # 1ms以下
-                    self.cache_hits += 1
-                    # キャッシュヒットの場合、通常の処理時間を推定して加算
-                    # 実際の数値はプロファイリングで調整が必要
-                    self.total_time_saved += 0.01  # 推定10ms
-            else:
-                result = cached_func(*args, **kwargs)
-                
-            return result
-        
-        # オリジナル関数の属性を保持
-        functools.update_wrapper(wrapper, func)
-        return wrapper
-    
+            Any: 変換された表現レベル
+        """
+        cache = self._cache
+        result = cache.pop(key, None)
+        if result is not None:
+            # ヒットしたエントリを末尾に移動してLRU順を維持する
+            cache[key] = result
+            self._hits += 1
+        else:
+            # MRO上のデータ変換元クラスの実装がそのまま呼ばれる
+            result = self._convert_impl(level)
+            self._misses += 1
+
+            cache_size = self.cache_size
+            if cache_size is not None and len(cache) >= cache_size:
+                cache.pop(next(iter(cache)))
+            cache[key] = result
+
+        self._last_input = level
+        self._last_result = result
+        return result
+
+    def clear_cache(self) -> None:
+        """変換結果のキャッシュをクリアします。"""
+        self._cache.clear()
+        self._last_input = None
+        self._last_result = None
+
+    def _bump_template_version(self) -> None:
+        """
+        テンプレートの差し替え後に呼び出し、キャッシュを無効化します。
+
+        世代番号を進めることで、クリア漏れがあっても古い世代の
+        エントリはキーが一致せず、LRUによって自然に追い出されます。
+        """
+        self._template_version += 1
+        self.clear_cache()
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """
         キャッシュの統計情報を返します。
-        
+
         戻り値:
             Dict[str, Any]: キャッシュの統計情報
         """
         if not self.cache_stats:
-            return {"enabled": False}
-            
-        total_calls = self.cache_hits + self.cache_misses
-        hit_rate = self.cache_hits / total_calls if total_calls > 0 else 0
-        
+            return _STATS_DISABLED
+
+        hits = self._hits
+        misses = self._misses
+        total_calls = hits + misses
         return {
             "enabled": True,
-            "hits": self.cache_hits,
-            "misses": self.cache_misses,
+            "hits": hits,
+            "misses": misses,
             "total_calls": total_calls,
-            "hit_rate": hit_rate,
-            "time_saved_sec": self.total_time_saved
+            "hit_rate": hits / total_calls if total_calls > 0 else 0,
+            "currsize": len(self._cache),
         }
 
 
@@ -127,7 +273,7 @@ class MemoizedIntentToParameterConverter(IntentToParameterConverter, MemoizedCon
     """
     
     def __init__(self, default_parameters: Optional[Dict[str, Dict[str, Any]]] = None,
-                 cache_size: int = 128, cache_stats: bool = False):
+                 cache_size: Optional[int] = 128, cache_stats: bool = False):
         """
         メモ化された意図からパラメータへの変換クラスを初期化します。
         
@@ -138,11 +284,44 @@ class MemoizedIntentToParameterConverter(IntentToParameterConverter, MemoizedCon
         """
         IntentToParameterConverter.__init__(self, default_parameters)
         MemoizedConverter.__init__(self, cache_size, cache_stats)
-        
-        # 変換関数をメモ化関数に置き換える
-        self._convert_impl_original = self._convert_impl
-        self._convert_impl = self._memoize_function(self._convert_impl)
-    
+
+    def update_templates(self, default_parameters: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        デフォルトパラメータを差し替え、キャッシュを無効化します。
+
+        引数:
+            default_parameters: 新しいデフォルトパラメータ
+                （Noneの場合はクラス既定値に戻る）
+        """
+        IntentToParameterConverter.__init__(self, default_parameters)
+        self._bump_template_version()
+
+    def _build_key(self, intent: IntentLevel) -> _HashedKey:
+        """
+        意図のキャッシュキーを構築します（オブジェクトごとに1回だけ）。
+
+        構築したキーはオブジェクト自身に保存し、同じ意図を再変換する
+        際はタプルの再構築を省きます。キーは変更時に破棄されます。
+        融合パイプライン（convert_intent_to_code）もこのキーを
+        そのまま利用します。
+
+        引数:
+            intent: 意図レベルの表現
+
+        戻り値:
+            _HashedKey: ハッシュ可能なキャッシュキー
+        """
+        key = intent._cache_key
+        if key is None:
+            key = intent._cache_key = _HashedKey((
+                intent.intent_type,
+                intent.description,
+                # ネストした辞書（extracted_parameters等）も扱える
+                _make_hashable(intent.metadata) if intent.metadata else tuple(),
+                intent.confidence
+            ))
+        return key
+
     def convert(self, intent: IntentLevel) -> ParameterLevel:
         """
         意図レベルの表現をパラメータレベルの表現に変換します。
@@ -158,51 +337,28 @@ class MemoizedIntentToParameterConverter(IntentToParameterConverter, MemoizedCon
         """
         # 入力の検証
         self._validate_input(intent)
-        
-        # キャッシュのキーとして使用するために不変表現に変換
+
+        # 直前と同一のオブジェクトならキー構築とハッシュ計算ごと省く
+        # （変更時は_cache_keyが破棄されるため、このチェックは外れる）
+        if intent is self._last_input and intent._cache_key is not None:
+            self._hits += 1
+            return self._last_result
+
         try:
-            # 直接_convert_implを呼び出す（キャッシュを使用）
-            result = self._convert_impl(
-                intent.intent_type,
-                intent.description,
-                # metadataは辞書型なのでJSONに変換してからtupleに変換
-                tuple(sorted(intent.metadata.items())) if intent.metadata else tuple(),
-                intent.confidence
-            )
-            return result
+            # キャッシュのキーとして使用するために不変表現に変換し、
+            # キャッシュを参照してミス時は元のオブジェクトで変換を実行
+            # （世代番号を先頭に付けて、古いテンプレートの結果を遮断する）
+            return self._memoized_convert(
+                (self._template_version, self._build_key(intent)), intent)
         except Exception as e:
             if isinstance(e, ConversionError):
                 raise
             else:
                 raise ConversionError(
-                    f"変換中にエラーが発生しました: {str(e)}", 
+                    f"変換中にエラーが発生しました: {str(e)}",
                     source_level=intent.__class__.__name__,
                     original_exception=e
                 )
-    
-    def _convert_impl(self, intent_type: IntentType, description: str, 
-                      metadata_tuple: Tuple, confidence: float) -> ParameterLevel:
-        """
-        意図レベルからパラメータレベルへの変換を実装します。
-        このメソッドはメモ化されます。
-        
-        引数:
-            intent_type: 意図の種類
-            description: 意図の説明
-            metadata_tuple: メタデータのタプル表現
-            confidence: 確信度
-            
-        戻り値:
-            ParameterLevel: 変換されたパラメータレベルの表現
-        """
-        # タプルを辞書に戻す
-        metadata = dict(metadata_tuple) if metadata_tuple else {}
-        
-        # IntentLevelオブジェクトを再構築
-        intent = IntentLevel(intent_type, description, metadata, confidence)
-        
-        # 元の変換処理を呼び出す
-        return self._convert_impl_original(intent)
 
 
 class MemoizedParameterToStructureConverter(ParameterToStructureConverter, MemoizedConverter):
@@ -214,7 +370,7 @@ class MemoizedParameterToStructureConverter(ParameterToStructureConverter, Memoi
     """
     
     def __init__(self, structure_templates: Optional[Dict[str, Dict[str, Any]]] = None,
-                 cache_size: int = 128, cache_stats: bool = False):
+                 cache_size: Optional[int] = 128, cache_stats: bool = False):
         """
         メモ化されたパラメータから構造への変換クラスを初期化します。
         
@@ -225,11 +381,20 @@ class MemoizedParameterToStructureConverter(ParameterToStructureConverter, Memoi
         """
         ParameterToStructureConverter.__init__(self, structure_templates)
         MemoizedConverter.__init__(self, cache_size, cache_stats)
-        
-        # 変換関数をメモ化関数に置き換える
-        self._convert_impl_original = self._convert_impl
-        self._convert_impl = self._memoize_function(self._convert_impl)
-    
+
+    def update_templates(self, structure_templates: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        構造テンプレートを差し替え、キャッシュを無効化します。
+
+        テンプレート選択用の索引も再構築されます。
+
+        引数:
+            structure_templates: 新しい構造テンプレート
+                （Noneの場合はクラス既定値に戻る）
+        """
+        ParameterToStructureConverter.__init__(self, structure_templates)
+        self._bump_template_version()
+
     def convert(self, param_level: ParameterLevel) -> StructureLevel:
         """
         パラメータレベルの表現を構造レベルの表現に変換します。
@@ -245,55 +410,40 @@ class MemoizedParameterToStructureConverter(ParameterToStructureConverter, Memoi
         """
         # 入力の検証
         self._validate_input(param_level)
-        
+
+        # 直前と同一のオブジェクトならキー構築とハッシュ計算ごと省く
+        if param_level is self._last_input and param_level._cache_key is not None:
+            self._hits += 1
+            return self._last_result
+
         try:
-            # パラメータの不変表現を作成
-            param_tuples = tuple(sorted([
-                (name, param.value_type, param.value, param.unit, 
-                 param.min_value, param.max_value, 
-                 tuple(sorted(param.metadata.items())) if param.metadata else tuple())
-                for name, param in param_level.parameters.items()
-            ]))
-            
-            # 不変表現を使用してメモ化メソッドを呼び出す
-            result = self._convert_impl(
-                param_tuples,
-                param_level.source_intent
-            )
-            return result
+            # パラメータの不変表現を作成（オブジェクトごとに1回だけ構築）
+            key = param_level._cache_key
+            if key is None:
+                # パラメータ名はほぼ一意なので、タプル全体の比較ではなく
+                # 名前だけをソートキーにして比較コストを抑える
+                param_tuples = tuple(sorted(
+                    ((name, param.value_type, param.value, param.unit,
+                      param.min_value, param.max_value,
+                      _make_hashable(param.metadata) if param.metadata else tuple())
+                     for name, param in param_level.parameters.items()),
+                    key=_first_item
+                ))
+                key = param_level._cache_key = _HashedKey(
+                    (param_tuples, param_level.source_intent))
+
+            # キャッシュを参照し、ミス時は元のオブジェクトで変換を実行
+            return self._memoized_convert(
+                (self._template_version, key), param_level)
         except Exception as e:
             if isinstance(e, ConversionError):
                 raise
             else:
                 raise ConversionError(
-                    f"変換中にエラーが発生しました: {str(e)}", 
+                    f"変換中にエラーが発生しました: {str(e)}",
                     source_level=param_level.__class__.__name__,
                     original_exception=e
                 )
-    
-    def _convert_impl(self, param_tuples: Tuple, source_intent: Optional[str]) -> StructureLevel:
-        """
-        パラメータレベルから構造レベルへの変換を実装します。
-        このメソッドはメモ化されます。
-        
-        引数:
-            param_tuples: パラメータの不変表現
-            source_intent: パラメータレベルの元となった意図
-            
-        戻り値:
-            StructureLevel: 変換された構造レベルの表現
-        """
-        # タプルからParameterLevelオブジェクトを再構築
-        parameters = {}
-        for param_tuple in param_tuples:
-            name, value_type, value, unit, min_value, max_value, metadata_tuple = param_tuple
-            metadata = dict(metadata_tuple) if metadata_tuple else {}
-            parameters[name] = ParameterValue(value_type, value, unit, min_value, max_value, metadata)
-        
-        param_level = ParameterLevel(parameters, source_intent)
-        
-        # 元の変換処理を呼び出す
-        return self._convert_impl_original(param_level)
 
 
 class MemoizedStructureToCodeConverter(StructureToCodeConverter, MemoizedConverter):
@@ -305,7 +455,7 @@ class MemoizedStructureToCodeConverter(StructureToCodeConverter, MemoizedConvert
     """
     
     def __init__(self, code_templates: Optional[Dict[str, Dict[str, Any]]] = None,
-                 cache_size: int = 128, cache_stats: bool = False):
+                 cache_size: Optional[int] = 128, cache_stats: bool = False):
         """
         メモ化された構造からコードへの変換クラスを初期化します。
         
@@ -316,11 +466,20 @@ class MemoizedStructureToCodeConverter(StructureToCodeConverter, MemoizedConvert
         """
         StructureToCodeConverter.__init__(self, code_templates)
         MemoizedConverter.__init__(self, cache_size, cache_stats)
-        
-        # 変換関数をメモ化関数に置き換える
-        self._convert_impl_original = self._convert_impl
-        self._convert_impl = self._memoize_function(self._convert_impl)
-    
+
+    def update_templates(self, code_templates: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        コードテンプレートを差し替え、キャッシュを無効化します。
+
+        オシレーター置換済みのSYNTHテンプレートも再構築されます。
+
+        引数:
+            code_templates: 新しいコードテンプレート
+                （Noneの場合はクラス既定値に戻る）
+        """
+        StructureToCodeConverter.__init__(self, code_templates)
+        self._bump_template_version()
+
     def convert(self, structure: StructureLevel) -> CodeLevel:
         """
         構造レベルの表現をコードレベルの表現に変換します。
@@ -336,124 +495,57 @@ class MemoizedStructureToCodeConverter(StructureToCodeConverter, MemoizedConvert
         """
         # 入力の検証
         self._validate_input(structure)
-        
+
+        # 直前と同一のオブジェクトならキー構築とハッシュ計算ごと省く
+        if structure is self._last_input and structure._cache_key is not None:
+            self._hits += 1
+            return self._last_result
+
         try:
-            # 構造の不変表現を作成
-            # 構造タイプ
-            structure_type_name = structure.structure_type.name
-            
-            # コンポーネントをタプルに変換
-            component_tuples = tuple(sorted([
-                (name, comp.component_type, comp.name, self._make_hashable(comp.value), 
-                 tuple(sorted(comp.metadata.items())) if comp.metadata else tuple())
-                for name, comp in structure.components.items()
-            ]))
-            
-            # 接続をタプルに変換
-            connection_tuples = tuple(sorted(structure.connections))
-            
-            # ソースパラメータをタプルに変換
-            source_param_tuples = tuple(sorted(structure.source_parameters))
-            
-            # メタデータをタプルに変換
-            metadata_tuples = tuple(sorted([
-                (key, self._make_hashable(value))
-                for key, value in structure.metadata.items()
-            ]))
-            
-            # 不変表現を使用してメモ化メソッドを呼び出す
-            result = self._convert_impl(
-                structure_type_name,
-                component_tuples,
-                connection_tuples,
-                source_param_tuples,
-                metadata_tuples
-            )
-            return result
+            # 構造の不変表現を作成（オブジェクトごとに1回だけ構築）
+            key = structure._cache_key
+            if key is None and orjson is not None:
+                # C実装のシリアライザで正準なbytesキーを生成する
+                # （to_dict_cachedの結果はオブジェクト側にメモ化済み）
+                try:
+                    key = structure._cache_key = _HashedKey(orjson.dumps(
+                        structure.to_dict_cached(),
+                        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                    ))
+                except TypeError:
+                    # JSON化できない値を含む場合はタプルキーで処理する
+                    pass
+            if key is None:
+                # コンポーネントをタプルに変換
+                # （名前集合ごとに専用コンパイルされた平坦化関数を使う）
+                components = structure.components
+                flatten = _compile_component_flattener(frozenset(components))
+                component_tuples = flatten(components)
+
+                # 列挙型メンバーはそのままハッシュ可能なのでキーに直接使う
+                # （.nameの文字列化とハッシュ計算を省く。意図側の変換器も
+                # 同様にIntentTypeメンバーをキーに使用している）
+                key = structure._cache_key = _HashedKey((
+                    structure.structure_type,
+                    component_tuples,
+                    tuple(sorted(structure.connections)),
+                    tuple(sorted(structure.source_parameters)),
+                    _hash_dict(structure.metadata)
+                ))
+
+            # キャッシュを参照し、ミス時は元のオブジェクトで変換を実行
+            return self._memoized_convert(
+                (self._template_version, key), structure)
         except Exception as e:
             if isinstance(e, ConversionError):
                 raise
             else:
                 raise ConversionError(
-                    f"変換中にエラーが発生しました: {str(e)}", 
+                    f"変換中にエラーが発生しました: {str(e)}",
                     source_level=structure.__class__.__name__,
                     original_exception=e
                 )
     
-    def _make_hashable(self, value: Any) -> Any:
-        """
-        値をハッシュ可能なものに変換します。
-        
-        引数:
-            value: 変換する値
-            
-        戻り値:
-            Any: ハッシュ可能な値
-        """
-        if isinstance(value, dict):
-            return tuple(sorted([
-                (key, self._make_hashable(val))
-                for key, val in value.items()
-            ]))
-        elif isinstance(value, list):
-            return tuple(self._make_hashable(v) for v in value)
-        elif isinstance(value, set):
-            return tuple(sorted(self._make_hashable(v) for v in value))
-        else:
-            return value
-    
-    def _convert_impl(self, structure_type_name: str, component_tuples: Tuple,
-                     connection_tuples: Tuple, source_param_tuples: Tuple,
-                     metadata_tuples: Tuple) -> CodeLevel:
-        """
-        構造レベルからコードレベルへの変換を実装します。
-        このメソッドはメモ化されます。
-        
-        引数:
-            structure_type_name: 構造タイプ名
-            component_tuples: コンポーネントの不変表現
-            connection_tuples: 接続の不変表現
-            source_param_tuples: ソースパラメータの不変表現
-            metadata_tuples: メタデータの不変表現
-            
-        戻り値:
-            CodeLevel: 変換されたコードレベルの表現
-        """
-        # タプルからStructureLevelオブジェクトを再構築
-        try:
-            structure_type = StructureType[structure_type_name]
-        except (KeyError, TypeError):
-            structure_type = StructureType.UNKNOWN
-        
-        # コンポーネントを再構築
-        components = {}
-        for comp_tuple in component_tuples:
-            name, component_type, comp_name, value, metadata_tuple = comp_tuple
-            metadata = dict(metadata_tuple) if metadata_tuple else {}
-            components[name] = StructureComponent(component_type, comp_name, value, metadata)
-        
-        # 接続を再構築
-        connections = list(connection_tuples)
-        
-        # ソースパラメータを再構築
-        source_parameters = list(source_param_tuples)
-        
-        # メタデータを再構築
-        metadata = {}
-        for key, value in metadata_tuples:
-            metadata[key] = value
-        
-        # StructureLevelオブジェクトを作成
-        structure = StructureLevel(
-            structure_type,
-            components,
-            connections,
-            source_parameters,
-            metadata
-        )
-        
-        # 元の変換処理を呼び出す
-        return self._convert_impl_original(structure)
 
 
 # 最適化された変換パイプラインクラス
@@ -465,7 +557,7 @@ class OptimizedConversionPipeline:
     最適化された変換クラスを使用して行います。
     """
     
-    def __init__(self, cache_size: int = 128, cache_stats: bool = False):
+    def __init__(self, cache_size: Optional[int] = 128, cache_stats: bool = False):
         """
         最適化された変換パイプラインを初期化します。
         
@@ -487,35 +579,71 @@ class OptimizedConversionPipeline:
             cache_size=cache_size,
             cache_stats=cache_stats
         )
-    
+
+        self._cache_size = cache_size
+        # 意図キー → 最終コードの融合キャッシュ
+        # （ヒット時は中間のパラメータ・構造オブジェクトの照合ごと省ける）
+        self._fused_cache: Dict[Any, CodeLevel] = {}
+
     def convert_intent_to_code(self, intent: IntentLevel) -> CodeLevel:
         """
         意図レベルの表現を直接コードレベルの表現に変換します。
-        
+
+        意図のキャッシュキーから最終コードを直接引く融合キャッシュを
+        先に参照するため、既知の意図では中間の各段階のキャッシュ照合と
+        中間オブジェクトの受け渡しを省略できます。ミス時は通常の
+        3段階の変換が実行され、各段階のキャッシュと統計も更新されます。
+
         引数:
             intent: 意図レベルの表現
-            
+
         戻り値:
             CodeLevel: 変換されたコードレベルの表現
-            
+
         例外:
             ConversionError: 変換中にエラーが発生した場合
         """
-        # 意図 -> パラメータ
-        param_level = self.intent_to_param.convert(intent)
-        
-        # パラメータ -> 構造
+        i2p = self.intent_to_param
+        i2p._validate_input(intent)
+
+        try:
+            key = i2p._build_key(intent)
+        except Exception as e:
+            raise ConversionError(
+                f"変換中にエラーが発生しました: {str(e)}",
+                source_level=intent.__class__.__name__,
+                original_exception=e
+            )
+
+        # 各段階のテンプレート世代を含めることで、変換器が個別に
+        # 更新された場合でも融合キャッシュの古い結果を遮断する
+        key = (i2p._template_version,
+               self.param_to_structure._template_version,
+               self.structure_to_code._template_version,
+               key)
+
+        fused = self._fused_cache
+        code_level = fused.pop(key, None)
+        if code_level is not None:
+            # ヒットしたエントリを末尾に移動してLRU順を維持する
+            fused[key] = code_level
+            return code_level
+
+        # 意図 -> パラメータ -> 構造 -> コード
+        param_level = i2p.convert(intent)
         structure = self.param_to_structure.convert(param_level)
-        
-        # 構造 -> コード
         code_level = self.structure_to_code.convert(structure)
-        
+
+        cache_size = self._cache_size
+        if cache_size is not None and len(fused) >= cache_size:
+            fused.pop(next(iter(fused)))
+        fused[key] = code_level
         return code_level
     
     def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
         """
         全変換器のキャッシュ統計情報を返します。
-        
+
         戻り値:
             Dict[str, Dict[str, Any]]: 各変換器のキャッシュ統計情報
         """
@@ -524,3 +652,89 @@ class OptimizedConversionPipeline:
             "param_to_structure": self.param_to_structure.get_cache_stats(),
             "structure_to_code": self.structure_to_code.get_cache_stats()
         }
+
+    def update_templates(self,
+                         default_parameters: Optional[Dict[str, Dict[str, Any]]] = None,
+                         structure_templates: Optional[Dict[str, Dict[str, Any]]] = None,
+                         code_templates: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        各変換器のテンプレートを差し替え、関連キャッシュを無効化します。
+
+        長時間稼働するプロセスでテンプレートをホットリロードしても、
+        古いテンプレートによる変換結果が残らないことを保証します。
+        Noneの引数に対応する変換器は変更されません。
+
+        引数:
+            default_parameters: 意図→パラメータ変換の新しいデフォルト値
+            structure_templates: パラメータ→構造変換の新しいテンプレート
+            code_templates: 構造→コード変換の新しいテンプレート
+        """
+        if default_parameters is not None:
+            self.intent_to_param.update_templates(default_parameters)
+        if structure_templates is not None:
+            self.param_to_structure.update_templates(structure_templates)
+        if code_templates is not None:
+            self.structure_to_code.update_templates(code_templates)
+        self._fused_cache.clear()
+
+    def _converters(self) -> Dict[str, MemoizedConverter]:
+        """名前 → 変換器の対応表を返します。"""
+        return {
+            "intent_to_param": self.intent_to_param,
+            "param_to_structure": self.param_to_structure,
+            "structure_to_code": self.structure_to_code
+        }
+
+    def save_cache(self, path: str) -> None:
+        """
+        全変換器のキャッシュ内容をファイルに保存します。
+
+        キャッシュキーは値（列挙型メンバーとプリミティブのタプル）から
+        構築されているため、プロセスをまたいでも安定して照合できます。
+        プロセスの再起動後にload_cache()で読み込むことで、
+        初回実行時のキャッシュミスを回避できます。
+
+        引数:
+            path: 保存先のファイルパス
+        """
+        snapshot = {name: converter._cache
+                    for name, converter in self._converters().items()}
+        with open(path, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_cache(self, path: str) -> None:
+        """
+        save_cache()で保存したキャッシュ内容を読み込みます。
+
+        各変換器のcache_sizeを超える分は、古い（先頭側の）
+        エントリから切り捨てられます。
+
+        引数:
+            path: 読み込むファイルパス
+        """
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+
+        for name, converter in self._converters().items():
+            cache = snapshot.get(name)
+            if not cache:
+                continue
+            excess = (0 if converter.cache_size is None
+                      else len(cache) - converter.cache_size)
+            if excess > 0:
+                # 挿入順＝LRU順なので、先頭側が最も古いエントリ
+                for key in list(cache)[:excess]:
+                    cache.pop(key)
+            converter._cache = cache
+
+    def clear_cache(self) -> None:
+        """
+        全変換器のキャッシュをクリアします。
+
+        呼び出し側が各変換器の内部属性に直接アクセスしなくて済むよう、
+        パイプラインが一括でキャッシュクリアを行います。
+        """
+        for converter in (self.intent_to_param, self.param_to_structure,
+                          self.structure_to_code):
+            converter.clear_cache()
+        self._fused_cache.clear()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SPACO - パラメータレベルの表現
+
+このモジュールは、意図から導出された音響合成パラメータを表す
+表現レベルを提供します。各パラメータは値・単位・範囲を持ちます。
+"""
+
+from enum import Enum
+from typing import Dict, Any, List, Optional
+import logging
+
+from .base import RepresentationLevel
+
+logger = logging.getLogger(__name__)
+
+
+class ParameterType(Enum):
+    """パラメータ値の種類"""
+    STATIC = "static"          # 固定値
+    DYNAMIC = "dynamic"        # 時間変化する値
+    MODULATED = "modulated"    # 変調される値
+
+
+class ParameterValue:
+    """
+    単一のパラメータ値
+
+    パラメータの値の種類・実際の値・単位・許容範囲・メタデータを保持します。
+    """
+
+    # パラメータ値は大量に生成されるため、固定スロットにして
+    # インスタンスごとの__dict__を省きメモリ使用量を抑える
+    __slots__ = ("value_type", "value", "unit", "min_value", "max_value",
+                 "metadata")
+
+    def __init__(self, value_type: str = "static", value: Any = None,
+                 unit: Optional[str] = None,
+                 min_value: Optional[float] = None,
+                 max_value: Optional[float] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        パラメータ値を初期化します。
+
+        引数:
+            value_type: 値の種類（"static"、"dynamic"、"modulated"）
+            value: パラメータの値
+            unit: 値の単位（例: "Hz"、"sec"）
+            min_value: 許容される最小値
+            max_value: 許容される最大値
+            metadata: 追加のメタデータ
+        """
+        self.value_type = value_type
+        self.value = value
+        self.unit = unit
+        self.min_value = min_value
+        self.max_value = max_value
+        self.metadata = metadata or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """パラメータ値を辞書形式に変換します。"""
+        return {
+            "value_type": self.value_type,
+            "value": self.value,
+            "unit": self.unit,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "metadata": self.metadata
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ParameterValue":
+        """辞書形式からパラメータ値を構築します。"""
+        return cls(
+            data.get("value_type", "static"),
+            data.get("value"),
+            data.get("unit"),
+            data.get("min_value"),
+            data.get("max_value"),
+            data.get("metadata")
+        )
+
+
+class ParameterLevel(RepresentationLevel):
+    """
+    パラメータレベルの表現クラス
+
+    名前からパラメータ値へのマッピングと、このパラメータセットの
+    元となった意図の識別子を保持します。
+    """
+
+    __slots__ = ("parameters", "source_intent", "metadata")
+
+    def __init__(self, parameters: Optional[Dict[str, ParameterValue]] = None,
+                 source_intent: Optional[str] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        パラメータレベルの表現を初期化します。
+
+        引数:
+            parameters: 名前 → パラメータ値のマッピング
+            source_intent: このパラメータセットの元となった意図の識別子
+            metadata: 追加のメタデータ
+        """
+        super().__init__()
+        self.parameters = parameters or {}
+        self.source_intent = source_intent
+        self.metadata = metadata or {}
+
+    def add_parameter(self, name: str, parameter: ParameterValue) -> None:
+        """
+        パラメータを追加します。
+
+        引数:
+            name: パラメータ名
+            parameter: パラメータ値
+        """
+        self.parameters[name] = parameter
+        self._invalidate_cache()
+
+    def get_parameter(self, name: str) -> Optional[ParameterValue]:
+        """
+        指定された名前のパラメータ値を取得します。
+
+        引数:
+            name: パラメータ名
+
+        戻り値:
+            Optional[ParameterValue]: パラメータ値（存在しない場合はNone）
+        """
+        return self.parameters.get(name)
+
+    def has_parameter(self, name: str) -> bool:
+        """
+        指定された名前のパラメータが存在するかどうかを返します。
+
+        引数:
+            name: パラメータ名
+
+        戻り値:
+            bool: パラメータが存在する場合はTrue
+        """
+        return name in self.parameters
+
+    def get_parameter_names(self) -> List[str]:
+        """
+        すべてのパラメータ名のリストを取得します。
+
+        戻り値:
+            List[str]: パラメータ名のリスト
+        """
+        return list(self.parameters.keys())
+
+    def validate(self) -> bool:
+        """
+        パラメータレベルの内容を検証します。
+
+        変換のたびに呼ばれるため、属性参照は1回に抑え、
+        type()の完全一致チェックでisinstanceのMRO走査を省いています。
+
+        戻り値:
+            bool: 内容が妥当な場合はTrue
+        """
+        parameters = self.parameters
+        if type(parameters) is not dict:
+            return False
+        for name, parameter in parameters.items():
+            if type(name) is not str or type(parameter) is not ParameterValue:
+                return False
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        パラメータレベルを辞書形式に変換します。
+
+        戻り値:
+            Dict[str, Any]: 辞書形式の表現
+        """
+        return {
+            "level": "parameter",
+            "parameters": {
+                name: parameter.to_dict()
+                for name, parameter in self.parameters.items()
+            },
+            "source_intent": self.source_intent,
+            "metadata": self.metadata
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ParameterLevel":
+        """
+        辞書形式からパラメータレベルを構築します。
+
+        引数:
+            data: 辞書形式の表現
+
+        戻り値:
+            ParameterLevel: 構築されたパラメータレベル
+        """
+        parameters = {}
+        for name, parameter_data in data.get("parameters", {}).items():
+            parameters[name] = ParameterValue.from_dict(parameter_data)
+
+        return cls(parameters, data.get("source_intent"), data.get("metadata"))
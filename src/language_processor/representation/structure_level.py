@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SPACO - 構造レベルの表現
+
+このモジュールは、パラメータから導出された音響合成の構造
+（コンポーネントとその接続）を表す表現レベルを提供します。
+"""
+
+from enum import Enum, auto
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+
+from .base import RepresentationLevel
+
+logger = logging.getLogger(__name__)
+
+
+class StructureType(Enum):
+    """構造の種類"""
+    SYNTH = auto()         # 単一のシンセ
+    EFFECT_CHAIN = auto()  # エフェクトチェーン
+    SEQUENCE = auto()      # シーケンス
+    INSTRUMENT = auto()    # 楽器定義
+    UNKNOWN = auto()       # 不明な構造
+
+
+# メンバー → 名前文字列の対応表
+# （.nameはディスクリプタ経由の参照になるため、ホットパスでは
+# この表を引く方が速い）
+STRUCTURE_TYPE_NAMES: Dict[StructureType, str] = {
+    m: m.name for m in StructureType}
+
+# 名前 → StructureTypeメンバーの対応表
+# （EnumMeta.__getitem__より高速で、未知の名前もget()で処理できる）
+_STRUCTURE_TYPE_BY_NAME: Dict[str, StructureType] = {
+    m.name: m for m in StructureType}
+
+
+class StructureComponent:
+    """
+    構造を構成する単一のコンポーネント
+
+    オシレーター、エンベロープ、出力などの構成要素を表します。
+    """
+
+    def __init__(self, component_type: str, name: str, value: Any = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        構造コンポーネントを初期化します。
+
+        引数:
+            component_type: コンポーネントの種類（例: "oscillator"、"envelope"）
+            name: コンポーネントの名前
+            value: コンポーネントの値
+            metadata: 追加のメタデータ
+        """
+        self.component_type = component_type
+        self.name = name
+        self.value = value
+        self.metadata = metadata or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """構造コンポーネントを辞書形式に変換します。"""
+        return {
+            "component_type": self.component_type,
+            "name": self.name,
+            "value": self.value,
+            "metadata": self.metadata
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StructureComponent":
+        """辞書形式から構造コンポーネントを構築します。"""
+        return cls(
+            data.get("component_type", ""),
+            data.get("name", ""),
+            data.get("value"),
+            data.get("metadata")
+        )
+
+
+class StructureLevel(RepresentationLevel):
+    """
+    構造レベルの表現クラス
+
+    構造の種類、コンポーネントのマッピング、コンポーネント間の接続、
+    および元となったパラメータ名を保持します。
+    """
+
+    __slots__ = ("structure_type", "components", "connections",
+                 "source_parameters", "metadata",
+                 "_connections_from", "_connections_to")
+
+    def __init__(self, structure_type: StructureType,
+                 components: Optional[Dict[str, StructureComponent]] = None,
+                 connections: Optional[List[Tuple[str, str]]] = None,
+                 source_parameters: Optional[List[str]] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        構造レベルの表現を初期化します。
+
+        引数:
+            structure_type: 構造の種類
+            components: 名前 → コンポーネントのマッピング
+            connections: (接続元, 接続先) のタプルのリスト
+            source_parameters: この構造の元となったパラメータ名のリスト
+            metadata: 追加のメタデータ
+        """
+        super().__init__()
+        self.structure_type = structure_type
+        self.components = components or {}
+        self.connections = connections or []
+        self.source_parameters = source_parameters or []
+        self.metadata = metadata or {}
+        # 接続元/接続先 → 接続リストの隣接索引のキャッシュ
+        # （初回の照会時に1回の走査で構築し、変更時に破棄される）
+        self._connections_from: Optional[Dict[str, List[Tuple[str, str]]]] = None
+        self._connections_to: Optional[Dict[str, List[Tuple[str, str]]]] = None
+
+    def add_component(self, name: str, component: StructureComponent) -> None:
+        """
+        コンポーネントを追加します。
+
+        引数:
+            name: コンポーネント名
+            component: 追加するコンポーネント
+        """
+        self.components[name] = component
+        self._invalidate_cache()
+
+    def get_component(self, name: str) -> Optional[StructureComponent]:
+        """
+        指定された名前のコンポーネントを取得します。
+
+        引数:
+            name: コンポーネント名
+
+        戻り値:
+            Optional[StructureComponent]: コンポーネント（存在しない場合はNone）
+        """
+        return self.components.get(name)
+
+    def add_connection(self, source: str, target: str) -> None:
+        """
+        コンポーネント間の接続を追加します。
+
+        引数:
+            source: 接続元のコンポーネント名
+            target: 接続先のコンポーネント名
+        """
+        self.connections.append((source, target))
+        self._invalidate_cache()
+
+    def _build_connection_index(self) -> None:
+        """接続リストを1回走査して両方向の隣接索引を構築します。"""
+        connections_from: Dict[str, List[Tuple[str, str]]] = {}
+        connections_to: Dict[str, List[Tuple[str, str]]] = {}
+        for conn in self.connections:
+            connections_from.setdefault(conn[0], []).append(conn)
+            connections_to.setdefault(conn[1], []).append(conn)
+        self._connections_from = connections_from
+        self._connections_to = connections_to
+
+    def get_connections_from(self, name: str) -> List[Tuple[str, str]]:
+        """
+        指定されたコンポーネントから出る接続を取得します。
+
+        接続リストを毎回走査する代わりに隣接索引を参照するため、
+        2回目以降の照会はO(1)です。
+
+        引数:
+            name: 接続元のコンポーネント名
+
+        戻り値:
+            List[Tuple[str, str]]: 該当する接続のリスト
+                （共有オブジェクト、変更不可）
+        """
+        if self._connections_from is None:
+            self._build_connection_index()
+        return self._connections_from.get(name, [])
+
+    def get_connections_to(self, name: str) -> List[Tuple[str, str]]:
+        """
+        指定されたコンポーネントへ入る接続を取得します。
+
+        接続リストを毎回走査する代わりに隣接索引を参照するため、
+        2回目以降の照会はO(1)です。
+
+        引数:
+            name: 接続先のコンポーネント名
+
+        戻り値:
+            List[Tuple[str, str]]: 該当する接続のリスト
+                （共有オブジェクト、変更不可）
+        """
+        if self._connections_to is None:
+            self._build_connection_index()
+        return self._connections_to.get(name, [])
+
+    def _invalidate_cache(self) -> None:
+        """接続の変更時に隣接索引も含めてキャッシュを破棄します。"""
+        super()._invalidate_cache()
+        self._connections_from = None
+        self._connections_to = None
+
+    def validate(self) -> bool:
+        """
+        構造レベルの内容を検証します。
+
+        戻り値:
+            bool: 内容が妥当な場合はTrue
+        """
+        if not isinstance(self.structure_type, StructureType):
+            return False
+        for name, component in self.components.items():
+            if not isinstance(name, str) or not isinstance(component, StructureComponent):
+                return False
+        # 接続が既存のコンポーネントを参照していることを確認
+        for source, target in self.connections:
+            if source not in self.components or target not in self.components:
+                return False
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        構造レベルを辞書形式に変換します。
+
+        戻り値:
+            Dict[str, Any]: 辞書形式の表現
+        """
+        return {
+            "level": "structure",
+            "structure_type": STRUCTURE_TYPE_NAMES[self.structure_type],
+            "components": {
+                name: component.to_dict()
+                for name, component in self.components.items()
+            },
+            "connections": [list(conn) for conn in self.connections],
+            "source_parameters": self.source_parameters,
+            "metadata": self.metadata
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StructureLevel":
+        """
+        辞書形式から構造レベルを構築します。
+
+        引数:
+            data: 辞書形式の表現
+
+        戻り値:
+            StructureLevel: 構築された構造レベル
+        """
+        structure_type = _STRUCTURE_TYPE_BY_NAME.get(
+            data.get("structure_type"), StructureType.UNKNOWN)
+
+        components = {}
+        for name, component_data in data.get("components", {}).items():
+            components[name] = StructureComponent.from_dict(component_data)
+
+        connections = [tuple(conn) for conn in data.get("connections", [])]
+
+        return cls(
+            structure_type,
+            components,
+            connections,
+            data.get("source_parameters"),
+            data.get("metadata")
+        )